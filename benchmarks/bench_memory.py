@@ -0,0 +1,67 @@
+"""
+Memory benchmark: bytes per key of a wrapped ConfigNode tree.
+
+Compares the current ConfigNode against the previous implementation
+(per-instance __dict__ and a copied list for every list value).
+
+Usage:
+    python benchmarks/bench_memory.py [--width 10] [--depth 4] [--list-size 8]
+"""
+import argparse
+import gc
+import tracemalloc
+
+from loadstructure.bench import count_keys, make_config
+from loadstructure.config_node import ConfigNode
+
+
+class LegacyConfigNode:
+    """The pre-__slots__ ConfigNode wrapping, kept here for comparison."""
+
+    def __init__(self, d=None):
+        object.__setattr__(self, "_data", {})
+        for key, value in (d or {}).items():
+            self._data[key] = self._wrap(value)
+
+    def _wrap(self, value):
+        if isinstance(value, dict):
+            return LegacyConfigNode(value)
+        if isinstance(value, list):
+            return [self._wrap(v) for v in value]
+        return value
+
+
+def measure(factory, raw) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    node = factory(raw)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del node
+    return after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ConfigNode memory benchmark")
+    parser.add_argument("--width", type=int, default=10)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--list-size", type=int, default=8)
+    args = parser.parse_args()
+
+    raw = make_config(args.width, args.depth, args.list_size)
+    keys = count_keys(raw)
+
+    results = {
+        "legacy": measure(LegacyConfigNode, raw),
+        "current": measure(ConfigNode, raw),
+        "current (lazy)": measure(lambda d: ConfigNode(d, None, lazy=True), raw),
+    }
+
+    print(f"keys: {keys}")
+    for name, size in results.items():
+        print(f"{name:>15}: {size:>12,} bytes  {size / keys:8.1f} bytes/key")
+
+
+if __name__ == "__main__":
+    main()
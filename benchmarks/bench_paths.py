@@ -0,0 +1,65 @@
+"""
+Dotted-path read benchmark.
+
+Compares the previous ConfigNode.get() traversal (split + walk on every
+call) with the indexed get() and a compiled path accessor.
+
+Usage:
+    python benchmarks/bench_paths.py [--width 10] [--depth 4] [--number 200000]
+"""
+import argparse
+import timeit
+
+from loadstructure.bench import make_config
+from loadstructure.config_node import ConfigNode
+
+
+def traverse(node, dotted_key, default=None):
+    """The pre-index ConfigNode.get()."""
+    for p in dotted_key.split("."):
+        if isinstance(node, ConfigNode) and p in node._data:
+            node = node._data[p]
+        else:
+            return default
+    return node
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ConfigNode dotted-path benchmark")
+    parser.add_argument("--width", type=int, default=10)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--number", type=int, default=200_000)
+    args = parser.parse_args()
+
+    cfg = ConfigNode(make_config(args.width, args.depth, 4))
+    # deepest path down the last branch, ending at an int leaf
+    parts, prefix = [], ""
+    for _ in range(args.depth - 1):
+        prefix += f"k{args.width - 1}"
+        parts.append(prefix)
+        prefix += "_"
+    key = ".".join(parts + [prefix + "k1"])
+    assert cfg.get(key) is not None, key
+    accessor = cfg.compile_path(key)
+
+    cases = {
+        "traversal (previous get)": lambda: traverse(cfg, key),
+        "indexed get()": lambda: cfg.get(key),
+        "compile_path().get()": accessor.get,
+    }
+
+    print(f"path: {key}  ({args.number:,} reads)")
+    for name, fn in cases.items():
+        seconds = min(timeit.repeat(fn, number=args.number, repeat=3))
+        print(f"{name:>26}: {seconds * 1e9 / args.number:8.1f} ns/read")
+
+    # reads interleaved with writes elsewhere in the tree (index rebuilds)
+    def read_write():
+        cfg.set("k0.k0_k0.counter", 1)
+        return cfg.get(key)
+    seconds = min(timeit.repeat(read_write, number=args.number // 10, repeat=3))
+    print(f"{'get() after each set()':>26}: {seconds * 1e9 / (args.number // 10):8.1f} ns/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,10 @@
 from loadstructure.main import ConfigManager
-from loadstructure.config_node import SchemaError
+from loadstructure.config_node import Change, SchemaError
+from loadstructure.schema import compile_schema
+from loadstructure.layered import LayeredNode
+from loadstructure.frozen import FrozenNode, freeze
+from loadstructure.journal import JournalEntry
+from loadstructure.pool import ConfigPool
+from loadstructure.codec import Codec, get_codec, register_codec
 
 version = '0.2.2'
\ No newline at end of file
@@ -0,0 +1,8 @@
+"""
+Benchmarks for load/access/merge/save on synthetic configs.
+
+    python -m loadstructure.bench --formats json,yaml --sizes small,medium -o before.json
+    loadstructure bench --compare before.json
+"""
+from loadstructure.bench.generator import SIZES, count_keys, make_config, write_config
+from loadstructure.bench.runner import OPERATIONS, compare, main, run
@@ -0,0 +1,5 @@
+import sys
+
+from loadstructure.bench.runner import main
+
+sys.exit(main())
@@ -0,0 +1,70 @@
+"""Synthetic configs of a given shape, written in any registered format."""
+import os
+
+from loadstructure.codec import get_codec
+
+# named shapes: (width, depth, list size)
+SIZES = {
+    "small": (4, 3, 4),
+    "medium": (8, 4, 8),
+    "large": (10, 5, 8),
+}
+
+
+def make_config(width: int, depth: int, list_size: int, fmt: str = "json") -> dict:
+    """
+    Build a synthetic config of `width` keys per level, `depth` levels deep.
+    Leaves cycle through lists, ints and strings. Formats with a fixed
+    shape are respected: "def" (INI) gets one level of sections with
+    scalar values only.
+    """
+    if get_codec(fmt).name == "def":
+        return {
+            f"section{s}": {
+                f"k{i}": i * s if i % 2 else f"value-{s}-{i}"
+                for i in range(width ** max(depth - 1, 1))
+            }
+            for s in range(width)
+        }
+
+    def level(d, prefix):
+        node = {}
+        for i in range(width):
+            key = f"{prefix}k{i}"
+            if d < depth:
+                node[key] = level(d + 1, f"{key}_")
+            elif i % 3 == 0:
+                node[key] = [f"item{j}" for j in range(list_size)]
+            elif i % 3 == 1:
+                node[key] = i * d
+            else:
+                node[key] = f"value-{key}"
+        return node
+    return level(1, "")
+
+
+def count_keys(d) -> int:
+    total = 0
+    for v in d.values():
+        total += 1
+        if isinstance(v, dict):
+            total += count_keys(v)
+    return total
+
+
+def deepest_path(d) -> str:
+    """Dotted path of the last leaf, following the last key at every level."""
+    parts = []
+    while isinstance(d, dict) and d:
+        key = next(reversed(d))
+        parts.append(key)
+        d = d[key]
+    return ".".join(parts)
+
+
+def write_config(path: str, data: dict, fmt: str | None = None) -> str:
+    """Write data to path with the codec for fmt (default: the extension)."""
+    codec = get_codec(fmt or os.path.splitext(path)[1])
+    with open(path, "w", encoding="utf-8") as f:
+        codec.dump(data, f)
+    return path
@@ -0,0 +1,221 @@
+"""
+Time every operation for each format and size; report JSON.
+
+Each result row holds the best per-call time over `repeat` rounds (the
+call count per round is calibrated like timeit's autorange) and the peak
+traced memory of one separate call, so tracemalloc never skews timings.
+"""
+import argparse
+import functools
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+
+from loadstructure.bench.generator import (
+    SIZES, count_keys, deepest_path, make_config, write_config,
+)
+from loadstructure.codec import get_codec
+from loadstructure.config_node import ConfigNode
+from loadstructure.main import ConfigManager
+
+OPERATIONS = ("parse", "wrap", "attr", "get", "set", "update", "to_dict", "merge", "save")
+FORMATS = ("json", "yaml", "xml", "toml", "def")
+
+
+def _best(fn, repeat: int) -> tuple[float, int]:
+    """(seconds per call, calls per round)."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number, number
+
+
+def _peak(fn) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _cases(fmt: str, path: str, workdir: str) -> tuple[dict, dict]:
+    ext = get_codec(fmt).extensions[0]
+    with open(path, "rb") as f:
+        buf = f.read()
+    manager = ConfigManager(path)
+    raw = manager.select_filetype(ext, buf)
+    node = ConfigNode(raw)
+    updated = ConfigNode(raw)
+    saved = ConfigManager(path)
+    saved.load()
+
+    dotted = deepest_path(raw)
+    parts = dotted.split(".")
+    first = next(iter(raw))
+    # second file for merge(): same shape, so every key is merged
+    other = os.path.join(workdir, "merge-" + os.path.basename(path))
+    if not os.path.exists(other):
+        with open(other, "wb") as f:
+            f.write(buf)
+    out = os.path.join(workdir, "saved-" + os.path.basename(path))
+
+    cases = {
+        "parse": lambda: manager.select_filetype(ext, buf),
+        "wrap": lambda: ConfigNode(raw),
+        "attr": lambda: functools.reduce(getattr, parts, node),
+        "get": lambda: node.get(dotted),
+        "set": lambda: node.set(dotted, 1),
+        "update": lambda: updated.update({first: raw[first]}),
+        "to_dict": node.to_dict,
+        "merge": lambda: ConfigManager.merge([path, other], jobs=1),
+        "save": lambda: saved.save(out, force=True),
+    }
+    info = {"keys": count_keys(raw), "file_bytes": len(buf), "path": dotted}
+    return cases, info
+
+
+def run(formats=FORMATS, sizes=("small", "medium"), operations=OPERATIONS,
+        repeat: int = 3, shape: tuple | None = None, progress=None) -> dict:
+    """
+    Benchmark formats × sizes × operations; returns a JSON-ready report.
+    shape = (width, depth, list size) overrides the named sizes.
+    progress = optional callable receiving each result row.
+    """
+    from loadstructure import version
+
+    named = {"custom": tuple(shape)} if shape else {s: SIZES[s] for s in sizes}
+    results = []
+    with tempfile.TemporaryDirectory(prefix="loadstructure-bench-") as workdir:
+        for fmt in formats:
+            codec = get_codec(fmt)
+            for size, (width, depth, list_size) in named.items():
+                data = make_config(width, depth, list_size, codec.name)
+                path = write_config(
+                    os.path.join(workdir, f"{size}{codec.extensions[0]}"), data, codec.name
+                )
+                cases, info = _cases(codec.name, path, workdir)
+                for op in operations:
+                    fn = cases[op]
+                    seconds, number = _best(fn, repeat)
+                    row = {
+                        "format": codec.name, "size": size,
+                        "width": width, "depth": depth, "list_size": list_size,
+                        "keys": info["keys"], "file_bytes": info["file_bytes"],
+                        "op": op, "seconds": seconds, "number": number,
+                        "peak_bytes": _peak(fn),
+                    }
+                    results.append(row)
+                    if progress:
+                        progress(row)
+    return {
+        "loadstructure": version,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "timestamp": time.time(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict) -> list[dict]:
+    """Match rows by (format, size, op); ratio > 1 means current is slower."""
+    key = lambda r: (r["format"], r["size"], r["op"])
+    before = {key(r): r for r in baseline["results"]}
+    rows = []
+    for r in current["results"]:
+        old = before.get(key(r))
+        if old is None:
+            continue
+        rows.append({
+            "format": r["format"], "size": r["size"], "op": r["op"],
+            "before": old["seconds"], "after": r["seconds"],
+            "ratio": r["seconds"] / old["seconds"] if old["seconds"] else float("inf"),
+        })
+    return rows
+
+
+# ---------------------------------------------------------
+# COMMAND LINE
+# ---------------------------------------------------------
+def _csv(value):
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def _fmt_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--formats", type=_csv, default=list(FORMATS),
+                        help="Comma separated formats (default: all built-in)")
+    parser.add_argument("--sizes", type=_csv, default=["small", "medium"],
+                        help=f"Comma separated sizes: {', '.join(SIZES)}")
+    parser.add_argument("--ops", type=_csv, default=list(OPERATIONS),
+                        help="Comma separated operations (default: all)")
+    parser.add_argument("--shape", type=int, nargs=3, metavar=("WIDTH", "DEPTH", "LIST"),
+                        help="Custom config shape instead of --sizes")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("-o", "--output", help="Write the JSON report to this file")
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="Compare against a previous JSON report")
+    parser.add_argument("--fail-above", type=float, metavar="RATIO",
+                        help="Exit with 1 if any operation got slower than RATIO × baseline")
+
+
+def run_from_args(args) -> int:
+    for op in args.ops:
+        if op not in OPERATIONS:
+            raise SystemExit(f"Unknown operation: {op}")
+    for size in args.sizes:
+        if size not in SIZES and not args.shape:
+            raise SystemExit(f"Unknown size: {size}")
+
+    def progress(row):
+        print(
+            f"{row['format']:>5} {row['size']:>7} {row['op']:>8}: "
+            f"{_fmt_time(row['seconds']):>10}  peak {row['peak_bytes'] / 1024:10.1f} KiB",
+            file=sys.stderr,
+        )
+
+    report = run(args.formats, args.sizes, args.ops, args.repeat, args.shape, progress)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if not args.compare:
+        return 0
+    with open(args.compare, encoding="utf-8") as f:
+        baseline = json.load(f)
+    worst = 0.0
+    for row in compare(baseline, report):
+        worst = max(worst, row["ratio"])
+        print(
+            f"{row['format']:>5} {row['size']:>7} {row['op']:>8}: "
+            f"{_fmt_time(row['before']):>10} → {_fmt_time(row['after']):>10}  x{row['ratio']:.2f}",
+            file=sys.stderr,
+        )
+    if args.fail_above is not None and worst > args.fail_above:
+        return 1
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="loadstructure bench", description="loadstructure benchmarks"
+    )
+    add_arguments(parser)
+    return run_from_args(parser.parse_args(argv))
@@ -0,0 +1,157 @@
+"""
+On-disk cache of parsed config files.
+
+Entries live in a private cache directory (default
+$XDG_CACHE_HOME/loadstructure or ~/.cache/loadstructure) and are keyed by
+absolute path + parser, then checked against size, mtime and a content hash.
+Least recently used entries are evicted once the directory exceeds max_bytes.
+
+Entries are pickles: only point the cache at a directory you own.
+Set LOADSTRUCTURE_CACHE=0 to disable every cache in the process.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+
+_MAGIC = b"LSC1"
+_SUFFIX = ".lsc"
+
+# returned by ParseCache.get() when there is no usable entry
+MISS = object()
+
+
+def _default_directory() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "loadstructure")
+
+
+def content_hash(content) -> str:
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+class ParseCache:
+    """Binary cache of parsed structures with an LRU size cap."""
+
+    def __init__(self, directory: str | None = None, max_bytes: int = 256 * 1024 * 1024):
+        self.directory = os.fspath(directory) if directory else _default_directory()
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+
+    def _entry_path(self, path: str, parser: str) -> str:
+        key = f"{os.path.abspath(path)}\0{parser}".encode("utf-8", "surrogateescape")
+        return os.path.join(self.directory, content_hash(key) + _SUFFIX)
+
+    # ---------- lookup ----------
+    def get(self, path: str, parser: str, stat: os.stat_result, content) -> object:
+        """Return the cached data, or MISS when absent or stale."""
+        entry = self._entry_path(path, parser)
+        try:
+            with open(entry, "rb") as f:
+                if f.read(len(_MAGIC)) != _MAGIC:
+                    return MISS
+                header = pickle.load(f)
+                if header != (
+                    os.path.abspath(path), stat.st_size, stat.st_mtime_ns,
+                    content_hash(content),
+                ):
+                    return MISS
+                data = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+            return MISS
+        # mark as recently used for LRU eviction
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        return data
+
+    # ---------- store ----------
+    def put(self, path: str, parser: str, stat: os.stat_result, content, data):
+        entry = self._entry_path(path, parser)
+        header = (
+            os.path.abspath(path), stat.st_size, stat.st_mtime_ns,
+            content_hash(content),
+        )
+        tmp = None
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(_MAGIC)
+                pickle.dump(header, f, pickle.HIGHEST_PROTOCOL)
+                pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+            # atomic → concurrent workers never read a partial entry
+            os.replace(tmp, entry)
+        except (OSError, pickle.PicklingError):
+            if tmp is not None:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+            return
+        self.evict()
+
+    # ---------- eviction ----------
+    def _entries(self):
+        out = []
+        with os.scandir(self.directory) as it:
+            for e in it:
+                if e.name.endswith(_SUFFIX):
+                    try:
+                        st = e.stat()
+                    except OSError:
+                        continue
+                    out.append((st.st_mtime_ns, st.st_size, e.path))
+        return out
+
+    def size(self) -> int:
+        """Total bytes used by cache entries."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self, max_bytes: int | None = None):
+        """Remove least recently used entries until the cache fits max_bytes."""
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        with self._lock:
+            entries = self._entries()
+            total = sum(size for _, size, _ in entries)
+            if total <= limit:
+                return
+            for _, size, entry in sorted(entries):
+                try:
+                    os.unlink(entry)
+                except OSError:
+                    continue
+                total -= size
+                if total <= limit:
+                    break
+
+    def clear(self):
+        self.evict(0)
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def resolve_cache(cache) -> ParseCache | None:
+    """
+    Map the ConfigManager `cache` argument to a ParseCache (or None):
+    None/False → off, True → shared default cache, str → cache directory.
+    """
+    if os.environ.get("LOADSTRUCTURE_CACHE", "").lower() in ("0", "off", "false", "no"):
+        return None
+    if cache is None or cache is False:
+        return None
+    if cache is True:
+        global _default
+        with _default_lock:
+            if _default is None:
+                _default = ParseCache()
+            return _default
+    if isinstance(cache, (str, os.PathLike)):
+        return ParseCache(cache)
+    return cache
@@ -1,19 +1,30 @@
 import argparse
+import glob
 import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 # Assuming loadstructure.main.ConfigManager is available
-from loadstructure.main import ConfigManager
+from loadstructure.main import ConfigManager, _write_atomic
+from loadstructure.bench.runner import add_arguments, run_from_args
+from loadstructure.codec import extensions, get_codec
 
 
-def convert_config(src, dst):
+def convert_config(src, dst, src_format=None, dst_format=None):
     if not os.path.exists(src):
         print(f"❌ Source file not found: {src}")
         sys.exit(1)
 
     try:
-        config = ConfigManager(src)
+        # load and save both go through the codec registry
+        config = ConfigManager(src, filetype=src_format)
         config.load()
-        config.save(dst)
+        # the destination format never falls back to --from (the manager's filetype)
+        dst_format = (
+            dst_format or os.path.splitext(dst)[1]
+            or src_format or os.path.splitext(src)[1]
+        )
+        config.save(dst, filetype=dst_format)
 
         print(f"✅ Converted successfully: {src} → {dst}")
 
@@ -22,6 +33,108 @@ def convert_config(src, dst):
         sys.exit(1)
 
 
+# ---------------------------------------------------------
+# BATCH CONVERT
+# ---------------------------------------------------------
+def _collect(inputs, src_format=None):
+    """
+    Expand files, directories (recursively) and globs into (source, relative
+    path) pairs; the relative path decides where the output goes.
+    """
+    known = extensions()
+    pairs = []
+    for pattern in inputs:
+        if os.path.isdir(pattern):
+            for root, dirs, files in os.walk(pattern):
+                dirs.sort()
+                for name in sorted(files):
+                    if src_format or os.path.splitext(name)[1].lower() in known:
+                        src = os.path.join(root, name)
+                        pairs.append((src, os.path.relpath(src, pattern)))
+        elif glob.has_magic(pattern):
+            # outputs mirror the part of each match below the first wildcard
+            base = pattern
+            while glob.has_magic(base):
+                base = os.path.dirname(base)
+            for src in sorted(glob.glob(pattern, recursive=True)):
+                if os.path.isfile(src):
+                    pairs.append((src, os.path.relpath(src, base or ".")))
+        else:
+            pairs.append((pattern, os.path.basename(pattern)))
+    return pairs
+
+
+def _convert_file(job):
+    """Convert one file without building a ConfigNode; runs in worker processes."""
+    src, dst, src_format, dst_format = job
+    try:
+        raw = ConfigManager(src, filetype=src_format)._read_raw()
+        codec = get_codec(dst_format)
+        os.makedirs(os.path.dirname(dst) or ".", exist_ok=True)
+        _write_atomic(dst, lambda f: codec.dump(raw, f))
+    except Exception as e:
+        return src, dst, f"{type(e).__name__}: {e}"
+    return src, dst, None
+
+
+def convert_batch(inputs, output_dir, dst_format, src_format=None, jobs=None, force=False) -> int:
+    """
+    Convert every config matched by inputs into output_dir as dst_format.
+    Outputs newer than their source are skipped unless force.
+    Returns the process exit code (1 if any file failed).
+    """
+    start = time.perf_counter()
+    codec = get_codec(dst_format)
+    if codec.dump is None:
+        print(f"❌ Format {codec.name!r} cannot be written")
+        return 1
+
+    plan, failed, skipped, targets = [], [], 0, {}
+    for src, rel in _collect(inputs, src_format):
+        dst = os.path.join(output_dir, os.path.splitext(rel)[0] + codec.extensions[0])
+        if dst in targets:
+            failed.append((src, f"same output as {targets[dst]}: {dst}"))
+            continue
+        targets[dst] = src
+        try:
+            src_mtime = os.stat(src).st_mtime_ns
+        except OSError as e:
+            failed.append((src, str(e)))
+            continue
+        try:
+            up_to_date = os.stat(dst).st_mtime_ns >= src_mtime
+        except FileNotFoundError:
+            up_to_date = False
+        if up_to_date and not force:
+            skipped += 1
+            continue
+        plan.append((src, dst, src_format, codec.name))
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs > 1 and len(plan) > 1:
+        jobs = min(jobs, len(plan))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            # many small files → hand them out in chunks
+            results = list(pool.map(_convert_file, plan, chunksize=max(1, len(plan) // (jobs * 4))))
+    else:
+        results = [_convert_file(job) for job in plan]
+
+    converted = 0
+    for src, dst, error in results:
+        if error is None:
+            converted += 1
+        else:
+            failed.append((src, error))
+
+    for src, error in failed:
+        print(f"❌ {src}: {error}")
+    print(
+        f"{'✅' if not failed else '⚠️'} {converted} converted, {skipped} up to date, "
+        f"{len(failed)} failed in {time.perf_counter() - start:.2f}s"
+    )
+    return 1 if failed else 0
+
+
 def main():
     parser = argparse.ArgumentParser(
         prog="loadstructure",
@@ -37,17 +150,43 @@ def main():
     )
     
     # --- CHANGED: Removed 'arrow' argument and simplified positional arguments ---
-    convert_parser.add_argument("source", help="Path to the source configuration file (e.g., config.json)")
-    convert_parser.add_argument("destination", help="Path for the destination configuration file (e.g., config.yaml)")
+    convert_parser.add_argument(
+        "paths", nargs="+", metavar="PATH",
+        help="Source and destination files (e.g., config.json config.yaml); "
+             "with --output-dir: any number of files, directories or globs"
+    )
     # ----------------------------------------------------------------------------
+    convert_parser.add_argument("--from", dest="src_format", help="Source format (default: from the extension)")
+    convert_parser.add_argument("--to", dest="dst_format", help="Destination format (default: from the extension)")
+    convert_parser.add_argument("-o", "--output-dir", help="Batch mode: write every converted file here")
+    convert_parser.add_argument("-j", "--jobs", type=int, help="Batch mode: worker processes (default: CPU count)")
+    convert_parser.add_argument("--force", action="store_true", help="Batch mode: also convert up-to-date outputs")
+
+    # bench command
+    bench_parser = sub.add_parser(
+        "bench",
+        help="Benchmark load/access/merge/save on synthetic configs (JSON report)"
+    )
+    add_arguments(bench_parser)
 
     args = parser.parse_args()
 
     if args.command == "convert":
         # The redundant check for 'args.arrow != "->"' is removed, 
         # as the 'arrow' argument no longer exists.
-        
-        convert_config(args.source, args.destination)
+        if args.output_dir:
+            if not args.dst_format:
+                convert_parser.error("--output-dir needs --to <format>")
+            sys.exit(convert_batch(
+                args.paths, args.output_dir, args.dst_format,
+                args.src_format, args.jobs, args.force,
+            ))
+        if len(args.paths) != 2:
+            convert_parser.error("expected <source> <destination> (or --output-dir for batch mode)")
+        convert_config(args.paths[0], args.paths[1], args.src_format, args.dst_format)
+
+    elif args.command == "bench":
+        sys.exit(run_from_args(args))
 
     else:
         # Prints general help if no command is specified
@@ -0,0 +1,369 @@
+"""
+Codec registry: one loader/dumper pair per format, looked up by extension
+or format name. Used by ConfigManager.load()/save() and the CLI.
+
+Built-in codecs pick the fastest implementation that is installed:
+    json → orjson for parsing when available (stdlib json otherwise)
+    yaml → libyaml (CSafeLoader / CDumper) when PyYAML was built with it
+    toml → tomllib for parsing; tomli_w for writing when available
+    xml  → xmltodict (expat)
+    def  → configparser
+
+json, yaml and toml also stream straight from a ConfigNode tree on save
+(dump_node), without building a plain-dict copy of the whole config first.
+
+Register your own with register_codec(); a later registration for the
+same name or extension replaces the earlier one.
+"""
+import configparser
+import io
+import json
+import re
+import threading
+import tomllib
+
+from loadstructure.config_node import ConfigNode
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import tomli_w
+except ImportError:
+    tomli_w = None
+try:
+    import toml
+except ImportError:
+    toml = None
+try:
+    import xmltodict
+except ImportError:
+    xmltodict = None
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+
+class Codec:
+    """
+    Loader/dumper pair for one format.
+    load(buf) → data, where buf is bytes or an mmap of the whole file.
+    dump(data, f) writes plain data to the text file f.
+    dump_node(node, f), optional, writes a ConfigNode tree the same way
+    without converting it to plain data first.
+    Either of load/dump may be None for read-only or write-only formats.
+    """
+    __slots__ = ("name", "extensions", "load", "dump", "dump_node")
+
+    def __init__(self, name: str, extensions=(), load=None, dump=None, dump_node=None):
+        self.name = name
+        self.extensions = tuple(_normalize(e) for e in extensions)
+        self.load = load
+        self.dump = dump
+        self.dump_node = dump_node
+
+    def __repr__(self):
+        return f"Codec({self.name!r}, {self.extensions})"
+
+
+_lock = threading.Lock()
+_by_name = {}
+_by_ext = {}
+
+
+def _normalize(ext: str) -> str:
+    ext = ext.lower()
+    return ext if ext.startswith(".") else "." + ext
+
+
+def register_codec(name: str, extensions=(), load=None, dump=None, dump_node=None) -> Codec:
+    """Register (or replace) the codec for name and its extensions."""
+    codec = Codec(name.lower(), extensions or ("." + name,), load, dump, dump_node)
+    with _lock:
+        _by_name[codec.name] = codec
+        for ext in codec.extensions:
+            _by_ext[ext] = codec
+    return codec
+
+
+def get_codec(key: str) -> Codec:
+    """Codec for an extension (".yml", "yml") or format name ("yaml")."""
+    key = key.lower()
+    codec = _by_ext.get(_normalize(key)) if key else None
+    if codec is None:
+        codec = _by_name.get(key.lstrip("."))
+    if codec is None:
+        raise ValueError(f"Unsupported file type: {key}")
+    return codec
+
+
+def extensions() -> tuple:
+    """Every registered extension."""
+    return tuple(_by_ext)
+
+
+# ---------------------------------------------------------
+# JSON
+# ---------------------------------------------------------
+def _load_json(buf):
+    if orjson is not None:
+        try:
+            return orjson.loads(buf if isinstance(buf, bytes) else memoryview(buf))
+        except orjson.JSONDecodeError:
+            # NaN/Infinity, huge ints... → stdlib parser (or its error message)
+            pass
+    return json.loads(buf if isinstance(buf, bytes) else str(buf, "utf-8"))
+
+
+def _dump_json(data, f):
+    json.dump(data, f, indent=4)
+
+
+def _node_data(value):
+    if isinstance(value, ConfigNode):
+        return value._data
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _emit_json(node, f):
+    # json.dump writes chunk by chunk; nodes are entered through default=
+    json.dump(node, f, indent=4, default=_node_data)
+
+
+# ---------------------------------------------------------
+# YAML
+# ---------------------------------------------------------
+def _yaml_classes():
+    if yaml is None:
+        raise ImportError("PyYAML is not installed. Run `uv add PyYAML`.")
+    return (
+        getattr(yaml, "CSafeLoader", yaml.SafeLoader),
+        getattr(yaml, "CDumper", yaml.Dumper),
+    )
+
+
+def _load_yaml(buf):
+    # bytes or a file-like mmap; the parser detects the encoding
+    return yaml.load(buf, Loader=_yaml_classes()[0])
+
+
+def _dump_yaml(data, f):
+    yaml.dump(data, f, Dumper=_yaml_classes()[1])
+
+
+def _emit_yaml(node, f):
+    """Same output as _dump_yaml, emitted event by event while walking the tree."""
+    dumper = _yaml_classes()[1](f, default_flow_style=False)
+    try:
+        dumper.open()
+        dumper.emit(yaml.DocumentStartEvent(explicit=False))
+        _yaml_value(dumper, node)
+        dumper.emit(yaml.DocumentEndEvent(explicit=False))
+        dumper.close()
+    finally:
+        dumper.dispose()
+
+
+def _yaml_value(dumper, value):
+    if isinstance(value, (ConfigNode, dict)):
+        items = value._data.items() if isinstance(value, ConfigNode) else value.items()
+        try:
+            # yaml.dump(sort_keys=True)
+            items = sorted(items)
+        except TypeError:
+            pass
+        dumper.emit(yaml.MappingStartEvent(None, "tag:yaml.org,2002:map", True, flow_style=False))
+        for k, v in items:
+            _yaml_value(dumper, k)
+            _yaml_value(dumper, v)
+        dumper.emit(yaml.MappingEndEvent())
+    elif isinstance(value, list):
+        dumper.emit(yaml.SequenceStartEvent(None, "tag:yaml.org,2002:seq", True, flow_style=False))
+        for v in value:
+            _yaml_value(dumper, v)
+        dumper.emit(yaml.SequenceEndEvent())
+    else:
+        # scalars (and other objects) → the dumper's own representer
+        node = dumper.represent_data(value)
+        dumper.represented_objects = {}
+        dumper.object_keeper = []
+        dumper.alias_key = None
+        _yaml_node(dumper, node)
+
+
+def _yaml_node(dumper, node):
+    if isinstance(node, yaml.ScalarNode):
+        implicit = (
+            node.tag == dumper.resolve(yaml.ScalarNode, node.value, (True, False)),
+            node.tag == dumper.resolve(yaml.ScalarNode, node.value, (False, True)),
+        )
+        dumper.emit(yaml.ScalarEvent(None, node.tag, implicit, node.value, style=node.style))
+    elif isinstance(node, yaml.SequenceNode):
+        implicit = node.tag == dumper.resolve(yaml.SequenceNode, node.value, True)
+        dumper.emit(yaml.SequenceStartEvent(None, node.tag, implicit, flow_style=node.flow_style))
+        for item in node.value:
+            _yaml_node(dumper, item)
+        dumper.emit(yaml.SequenceEndEvent())
+    else:
+        implicit = node.tag == dumper.resolve(yaml.MappingNode, node.value, True)
+        dumper.emit(yaml.MappingStartEvent(None, node.tag, implicit, flow_style=node.flow_style))
+        for key, value in node.value:
+            _yaml_node(dumper, key)
+            _yaml_node(dumper, value)
+        dumper.emit(yaml.MappingEndEvent())
+
+
+# ---------------------------------------------------------
+# XML
+# ---------------------------------------------------------
+def _load_xml(buf):
+    if xmltodict is None:
+        raise ImportError("xmltodict is not installed. Run `uv add xmltodict`.")
+    # bytes → expat in one go, mmap → streamed through read()
+    xml = xmltodict.parse(buf)
+    # Flatten root element if only one top-level key
+    if len(xml) == 1:
+        return list(xml.values())[0]
+    return xml
+
+
+def _dump_xml(data, f):
+    if xmltodict is None:
+        raise ImportError("xmltodict not installed. Run `uv add xmltodict`.")
+    # wrap all keys in root
+    xmltodict.unparse({"config": data}, output=f, pretty=True)
+
+
+# ---------------------------------------------------------
+# TOML
+# ---------------------------------------------------------
+def _load_toml(buf):
+    return tomllib.loads(str(buf, "utf-8"))
+
+
+def _dump_toml(data, f):
+    if tomli_w is not None:
+        try:
+            f.write(tomli_w.dumps(data))
+            return
+        except TypeError:
+            # None values: toml drops them, tomli_w refuses
+            if toml is None:
+                raise
+    if toml is None:
+        raise ImportError("No TOML writer installed. Run `uv add tomli-w`.")
+    toml.dump(data, f)
+
+
+_BARE_KEY = re.compile(r"[A-Za-z0-9_-]+")
+
+
+def _toml_key(key) -> str:
+    key = str(key)
+    return key if _BARE_KEY.fullmatch(key) else json.dumps(key, ensure_ascii=False)
+
+
+def _is_table(value) -> bool:
+    return isinstance(value, (ConfigNode, dict))
+
+
+def _emit_toml(node, f):
+    """
+    Write a ConfigNode tree table by table: only the plain key/value lines
+    of one table are converted (and formatted by _dump_toml) at a time.
+    """
+    _toml_table(node, f, "", False, [False])
+
+
+def _toml_table(table, f, name, in_array, written):
+    items = table._data.items() if isinstance(table, ConfigNode) else table.items()
+    literals = {}
+    tables = []
+    for k, v in items:
+        if _is_table(v):
+            tables.append((k, v, False))
+        elif isinstance(v, list) and v and all(_is_table(x) for x in v):
+            tables.extend((k, x, True) for x in v)
+        else:
+            literals[k] = v
+
+    if name and (in_array or literals or not tables):
+        if written[0]:
+            f.write("\n")
+        f.write(f"[[{name}]]\n" if in_array else f"[{name}]\n")
+        written[0] = True
+    if literals:
+        buf = io.StringIO()
+        _dump_toml({k: _plain(v) for k, v in literals.items()}, buf)
+        f.write(buf.getvalue())
+        written[0] = True
+    for k, v, array in tables:
+        sub = f"{name}.{_toml_key(k)}" if name else _toml_key(k)
+        _toml_table(v, f, sub, array, written)
+
+
+def _plain(value):
+    if isinstance(value, ConfigNode):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    return value
+
+
+# ---------------------------------------------------------
+# DEF (INI)
+# ---------------------------------------------------------
+def cast_value(value: str):
+    # Try bool
+    if value.lower() in ("true", "yes", "1"):
+        return True
+    if value.lower() in ("false", "no", "0"):
+        return False
+    # Try int
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    # Try float
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    # Return as string
+    return value
+
+
+def _load_def(buf):
+    parser = configparser.ConfigParser()
+    parser.read_string(str(buf, "utf-8"))
+    data = {}
+    for section in parser.sections():
+        data[section] = {}
+        for key, value in parser.items(section):
+            # Try to auto-cast int, float, bool if possible
+            data[section][key] = cast_value(value)
+    return data
+
+
+def _dump_def(data: dict, f):
+    parser = configparser.ConfigParser()
+
+    for section, values in data.items():
+        parser[section] = {}
+        for key, value in values.items():
+            # Convert booleans to 'true'/'false' strings
+            if isinstance(value, bool):
+                parser[section][key] = "true" if value else "false"
+            else:
+                parser[section][key] = str(value)
+
+    parser.write(f)
+
+
+register_codec("json", (".json",), _load_json, _dump_json, _emit_json)
+register_codec("yaml", (".yaml", ".yml"), _load_yaml, _dump_yaml, _emit_yaml)
+register_codec("xml", (".xml",), _load_xml, _dump_xml)
+register_codec("toml", (".toml",), _load_toml, _dump_toml, _emit_toml)
+register_codec("def", (".def",), _load_def, _dump_def)
@@ -1,15 +1,103 @@
-class SchemaError(Exception):
-    """Raised when configuration does not match the schema rules."""
-    pass
+from typing import Any, NamedTuple
+
+from loadstructure import stats as _stats
+from loadstructure.journal import Journal, JournalEntry, from_pointer, to_pointer
+from loadstructure.schema import SchemaError, compile_schema
+
+
+_MISSING = object()
+# marks "a path ends here" inside a get_many/set_many prefix trie
+_LEAF = object()
+
+
+class Change(NamedTuple):
+    """One difference found by reload(): kind is "added", "removed" or "changed"."""
+    path: str
+    kind: str
+    old: Any
+    new: Any
+
+
+def _join(path, key):
+    return f"{path}.{key}" if path else str(key)
+
+
+def _plain(v):
+    if isinstance(v, ConfigNode):
+        return v.to_dict()
+    if isinstance(v, list):
+        return [_plain(x) for x in v]
+    if isinstance(v, dict):
+        return {k: _plain(x) for k, x in v.items()}
+    return v
+
+
+def _locate(value, target):
+    """() if value is target, (index, ...) if target sits in (nested) lists, else None."""
+    if value is target:
+        return ()
+    if isinstance(value, list):
+        for i, v in enumerate(value):
+            found = _locate(v, target)
+            if found is not None:
+                return (i,) + found
+    return None
+
+
+def _same(a, b):
+    return type(a) is type(b) and a == b
+
+
+def _diff_dicts(old: dict, new: dict, path: str, changes: list):
+    """Record the differences between two plain dicts as Change entries."""
+    for key, value in old.items():
+        if key not in new:
+            changes.append(Change(_join(path, key), "removed", value, None))
+    for key, value in new.items():
+        sub = _join(path, key)
+        if key not in old:
+            changes.append(Change(sub, "added", None, value))
+        elif isinstance(value, dict) and isinstance(old[key], dict):
+            _diff_dicts(old[key], value, sub, changes)
+        elif not _same(old[key], value):
+            changes.append(Change(sub, "changed", old[key], value))
 
 
 class ConfigNode:
-    def __init__(self, d=None, schema=None):
+    __slots__ = ("_data", "_schema", "_pending", "_parent", "_gen", "_index", "_journal", "_dict")
+
+    def __init__(self, d=None, schema=None, lazy=False, _parent=None):
+        if schema is not None:
+            schema = compile_schema(schema)
         object.__setattr__(self, "_data", {})
         object.__setattr__(self, "_schema", schema)
+        # lazy mode → keys whose raw value is not wrapped/validated yet
+        object.__setattr__(self, "_pending", set() if lazy else None)
+        # generation: bumped on every mutation of this node or a descendant
+        object.__setattr__(self, "_parent", _parent)
+        object.__setattr__(self, "_gen", 0)
+        # (generation, {dotted key: value}) cache used by get()
+        object.__setattr__(self, "_index", None)
+        # (generation, plain dict) cache used by to_dict(copy=False)
+        object.__setattr__(self, "_dict", None)
+        # mutation journal, only kept on a root with enable_journal()
+        object.__setattr__(self, "_journal", None)
+        counters = _stats.node_counters
+        if counters is not None:
+            counters.nodes_created += 1
 
         d = d or {}
 
+        if lazy:
+            self._data.update(d)
+            if schema is not None:
+                self._pending.update(d)
+            else:
+                self._pending.update(
+                    k for k, v in d.items() if isinstance(v, (dict, list))
+                )
+            return
+
         for key, value in d.items():
             rule = schema.get(key) if schema else None
             self._data[key] = self._wrap(value, rule)
@@ -18,53 +106,118 @@ class ConfigNode:
     # WRAPPING + VALIDATION
     # ---------------------------------------------------------
     def _validate(self, rule, value):
-        if rule is None:
-            return
-
-        # rule == dict TYPE (not schema)
-        if rule == dict:
-            if not isinstance(value, (dict, ConfigNode)):
-                raise SchemaError(f"value must be dict, got {type(value).__name__}")
-            return
-
-        # rule is LIST TYPE
-        if rule == list:
-            if not isinstance(value, list):
-                raise SchemaError(f"value must be list, got {type(value).__name__}")
-            return
-
-        # rule is a nested SCHEMA dict
-        if isinstance(rule, dict):
-            if not isinstance(value, (dict, ConfigNode)):
-                raise SchemaError(f"value must be object/dict for schema field")
-            return
-
-        # primitive type
-        if isinstance(rule, type):
-            if not isinstance(value, rule):
-                raise SchemaError(
-                    f"value must be {rule.__name__}, got {type(value).__name__}"
-                )
+        if rule is not None:
+            counters = _stats.node_counters
+            if counters is None:
+                rule.validate(value)
+            else:
+                counters.validate(rule, value)
 
     def _wrap(self, value, rule=None):
-        self._validate(rule, value)
-
-        # case: nested schema → wrap dict
-        if isinstance(rule, dict):
-            return ConfigNode(value if isinstance(value, dict) else {}, rule)
+        if rule is not None:
+            counters = _stats.node_counters
+            if counters is None:
+                rule.validate(value)
+            else:
+                counters.validate(rule, value)
+        return self._build(value, rule)
 
-        # dict type → wrap as free dict (no subschema)
-        if rule == dict:
-            return ConfigNode(value, None) if isinstance(value, dict) else value
+    def _build(self, value, rule):
+        """Wrap an already validated value."""
+        lazy = self._pending is not None
 
-        # default wrapping
         if isinstance(value, dict):
-            return ConfigNode(value, None)
+            return ConfigNode(value, rule.subschema if rule else None, lazy, self)
+
+        if isinstance(value, ConfigNode):
+            # node checked against a different schema → rebuild under this one
+            if (rule is not None and rule.subschema is not None
+                    and value._schema is not rule.subschema):
+                return ConfigNode(value.to_dict(), rule.subschema, lazy, self)
+            # node still attached to another tree → copy it
+            if value._parent is not None and value._parent is not self:
+                return ConfigNode(value.to_dict(), value._schema, lazy, self)
+            object.__setattr__(value, "_parent", self)
+            return value
+
         if isinstance(value, list):
-            return [self._wrap(v) for v in value]
+            item = rule.item if rule else None
+            # lists of plain scalars are stored as-is (no copy)
+            for v in value:
+                if isinstance(v, (dict, list)):
+                    return [self._build(x, item) for x in value]
+            return value
 
         return value
 
+    # ---------------------------------------------------------
+    # LAZY MATERIALIZATION
+    # ---------------------------------------------------------
+    def _child(self, key):
+        """Return the wrapped value for an existing key, wrapping it on first use."""
+        value = self._data[key]
+        pending = self._pending
+        if pending and key in pending:
+            rule = self._schema.get(key) if self._schema else None
+            value = self._wrap(value, rule)
+            self._data[key] = value
+            pending.discard(key)
+        return value
+
+    def _store(self, key, value):
+        """Store an already wrapped value."""
+        op = "replace" if key in self._data else "add"
+        self._data[key] = value
+        if self._pending:
+            self._pending.discard(key)
+        self._record(op, (key,), value)
+
+    def _remove(self, key):
+        del self._data[key]
+        if self._pending:
+            self._pending.discard(key)
+        self._record("remove", (key,), None)
+
+    def _touch(self):
+        """Bump the generation of this node and all its ancestors; returns the root."""
+        node = self
+        while True:
+            object.__setattr__(node, "_gen", node._gen + 1)
+            if node._parent is None:
+                return node
+            node = node._parent
+
+    def _record(self, op, parts, value):
+        """Mark the tree as mutated and append to the root journal if enabled."""
+        journal = self._touch()._journal
+        if journal is not None:
+            where = self._parts()
+            # detached node → its changes are not part of the tree anymore
+            if where is not None:
+                journal.append(op, where + tuple(parts), _plain(value))
+
+    def _parts(self):
+        """Path from the root to this node as a tuple of keys/list indexes."""
+        parts = []
+        node = self
+        while node._parent is not None:
+            parent = node._parent
+            for key, value in parent._data.items():
+                found = _locate(value, node)
+                if found is not None:
+                    parts.extend(reversed((key,) + found))
+                    break
+            else:
+                return None
+            node = parent
+        return tuple(reversed(parts))
+
+    def _materialize(self):
+        """Wrap every pending child of this node (one level deep)."""
+        if self._pending:
+            for key in list(self._pending):
+                self._child(key)
+
     # ---------------------------------------------------------
     # ATTRIBUTE GET (AUTO-CREATE)
     # ---------------------------------------------------------
@@ -73,8 +226,9 @@ class ConfigNode:
         # free mode → always auto-create
         if self._schema is None:
             if key not in self._data:
-                self._data[key] = ConfigNode({}, None)
-            return self._data[key]
+                self._store(key, ConfigNode({}, None, self._pending is not None, self))
+                self._count_auto_create()
+            return self._child(key)
 
         # schema mode → key must exist
         if key not in self._schema:
@@ -82,39 +236,38 @@ class ConfigNode:
 
         # already exists
         if key in self._data:
-            return self._data[key]
+            return self._child(key)
 
-        # rule decides auto creation
+        # rule decides auto creation (nested schema or dict)
         rule = self._schema[key]
-
-        # nested schema
-        if isinstance(rule, dict):
-            node = ConfigNode({}, rule)
-            self._data[key] = node
-            return node
-
-        # dict allowed
-        if rule == dict:
-            node = ConfigNode({}, None)
-            self._data[key] = node
+        if rule.container:
+            node = ConfigNode({}, rule.subschema, self._pending is not None, self)
+            self._store(key, node)
+            self._count_auto_create()
             return node
 
         # primitive → cannot auto-create
         raise SchemaError(
-            f"Cannot auto-create '{key}' because schema expects primitive: {rule.__name__}"
+            f"Cannot auto-create '{key}' because schema expects primitive: {rule.name}"
         )
 
+    @staticmethod
+    def _count_auto_create():
+        counters = _stats.node_counters
+        if counters is not None:
+            counters.auto_created += 1
+
     # ---------------------------------------------------------
     # ATTRIBUTE SET
     # ---------------------------------------------------------
     def __setattr__(self, key, value):
 
-        if key in ("_data", "_schema"):
+        if key in ConfigNode.__slots__:
             return object.__setattr__(self, key, value)
 
         # free mode
         if self._schema is None:
-            self._data[key] = self._wrap(value, None)
+            self._store(key, self._wrap(value, None))
             return
 
         # schema mode
@@ -122,7 +275,7 @@ class ConfigNode:
             raise SchemaError(f"'{key}' is not allowed by the schema.")
 
         rule = self._schema[key]
-        self._data[key] = self._wrap(value, rule)
+        self._store(key, self._wrap(value, rule))
 
     # ---------------------------------------------------------
     # DICT ACCESS
@@ -132,25 +285,49 @@ class ConfigNode:
 
     def __setitem__(self, key, value):
         rule = self._schema.get(key) if self._schema else None
-        self._data[key] = self._wrap(value, rule)
+        self._store(key, self._wrap(value, rule))
 
     # ---------------------------------------------------------
     # GET USING DOTTED PATH
     # ---------------------------------------------------------
     def get(self, dotted_key, default=None):
+        # index hit → O(1) until this subtree is mutated
+        index = self._index
+        if index is not None and index[0] == self._gen:
+            value = index[1].get(dotted_key, _MISSING)
+            if value is not _MISSING:
+                return value
+
+        value = self._walk(dotted_key.split("."))
+        if value is _MISSING:
+            return default
+
+        if index is None or index[0] != self._gen:
+            index = (self._gen, {})
+            object.__setattr__(self, "_index", index)
+        index[1][dotted_key] = value
+        return value
+
+    def _walk(self, parts):
         node = self
-        for p in dotted_key.split("."):
+        for p in parts:
             if isinstance(node, ConfigNode) and p in node._data:
-                node = node._data[p]
+                node = node._child(p)
             else:
-                return default
+                return _MISSING
         return node
 
+    def compile_path(self, dotted_key: str) -> "ConfigPath":
+        """Return a reusable accessor for dotted_key (split once, reads cached)."""
+        return ConfigPath(self, dotted_key)
+
     # ---------------------------------------------------------
     # SET USING DOTTED PATH
     # ---------------------------------------------------------
     def set(self, dotted_key: str, value):
-        parts = dotted_key.split(".")
+        self._set_parts(dotted_key.split("."), value)
+
+    def _set_parts(self, parts, value):
         node = self
 
         for p in parts[:-1]:
@@ -161,18 +338,15 @@ class ConfigNode:
                 if p not in node._schema:
                     raise SchemaError(f"'{p}' is not allowed by the schema.")
                 rule = node._schema[p]
-                if isinstance(rule, dict):
-                    subschema = rule
-                elif rule == dict:
-                    subschema = None
-                else:
+                if not rule.container:
                     raise SchemaError(
-                        f"Cannot auto-create '{p}' because schema expects primitive {rule.__name__}"
+                        f"Cannot auto-create '{p}' because schema expects primitive {rule.name}"
                     )
+                subschema = rule.subschema
 
             # create if not existing
-            if p not in node._data or not isinstance(node._data[p], ConfigNode):
-                node._data[p] = ConfigNode({}, subschema)
+            if p not in node._data or not isinstance(node._child(p), ConfigNode):
+                node._store(p, ConfigNode({}, subschema, node._pending is not None, node))
 
             node = node._data[p]
 
@@ -183,11 +357,113 @@ class ConfigNode:
             if last not in node._schema:
                 raise SchemaError(f"'{last}' is not allowed by the schema.")
             rule = node._schema[last]
-            node._data[last] = self._wrap(value, rule)
+            node._store(last, node._wrap(value, rule))
             return
 
         # free mode
-        node._data[last] = self._wrap(value, None)
+        node._store(last, node._wrap(value, None))
+
+    # ---------------------------------------------------------
+    # BATCH GET / SET
+    # ---------------------------------------------------------
+    @staticmethod
+    def _trie(items):
+        """Group (dotted key, payload) pairs by common prefix."""
+        trie = {}
+        for dotted_key, payload in items:
+            t = trie
+            for p in dotted_key.split("."):
+                t = t.setdefault(p, {})
+            t[_LEAF] = payload
+        return trie
+
+    def get_many(self, paths, default=None) -> dict:
+        """
+        Read several dotted keys at once; shared prefixes are walked once.
+        Returns {dotted key: value} in the order given.
+        """
+        paths = list(paths)
+        found = {}
+
+        def walk(node, trie):
+            for key, sub in trie.items():
+                if key is _LEAF:
+                    found[sub] = node
+                elif isinstance(node, ConfigNode) and key in node._data:
+                    walk(node._child(key), sub)
+
+        walk(self, self._trie((p, p) for p in paths))
+        return {p: found.get(p, default) for p in paths}
+
+    def set_many(self, mapping: dict):
+        """
+        Set several dotted keys as one batch.
+        Every value is validated before anything is applied, so a schema
+        violation leaves the tree untouched. Shared prefixes are walked
+        once; a key is applied before any longer key below it.
+        """
+        trie = self._trie(mapping.items())
+        errors = []
+        self._plan_many(self, self._schema, trie, "", errors)
+        if errors:
+            raise errors[0]
+        self._apply_many(trie)
+
+    @staticmethod
+    def _plan_many(node, schema, trie, prefix, errors):
+        """Validate a set_many trie against node (None → node not created yet)."""
+        for key, sub in trie.items():
+            if key is _LEAF:
+                continue
+            path = _join(prefix, key)
+            rule = None
+            if schema is not None:
+                if key not in schema:
+                    errors.append(SchemaError(f"{path}: '{key}' is not allowed by the schema.", path))
+                    continue
+                rule = schema[key]
+
+            # deep check: nested dicts/list items are only wrapped in _apply_many
+            if _LEAF in sub and rule is not None:
+                if not rule.collect(sub[_LEAF], path, errors, strict=False):
+                    continue
+
+            if len(sub) == 1 and _LEAF in sub:
+                continue
+
+            # deeper keys → this key is (or becomes) a node
+            child = None
+            if _LEAF not in sub and node is not None and key in node._data:
+                child = node._child(key)
+            if isinstance(child, ConfigNode):
+                child_schema = child._schema
+            else:
+                child = None
+                if rule is not None and not rule.container:
+                    errors.append(SchemaError(
+                        f"{path}: Cannot auto-create '{key}' because schema expects primitive {rule.name}",
+                        path,
+                    ))
+                    continue
+                child_schema = rule.subschema if rule is not None else None
+            ConfigNode._plan_many(child, child_schema, sub, path, errors)
+
+    def _apply_many(self, trie):
+        """Apply an already validated set_many trie."""
+        schema = self._schema
+        lazy = self._pending is not None
+        for key, sub in trie.items():
+            if key is _LEAF:
+                continue
+            rule = schema[key] if schema is not None else None
+            if _LEAF in sub:
+                self._store(key, self._build(sub[_LEAF], rule))
+            if len(sub) > (1 if _LEAF in sub else 0):
+                child = self._child(key) if key in self._data else None
+                if not isinstance(child, ConfigNode):
+                    child = ConfigNode({}, rule.subschema if rule is not None else None, lazy, self)
+                    self._store(key, child)
+                child._apply_many(sub)
 
     # ---------------------------------------------------------
     # UPDATE / REPLACE
@@ -201,11 +477,11 @@ class ConfigNode:
                     raise SchemaError(f"'{key}' is not allowed by schema.")
 
                 rule = self._schema[key]
-                self._data[key] = self._wrap(value, rule)
+                self._store(key, self._wrap(value, rule))
                 continue
 
             # free mode
-            self._data[key] = self._wrap(value, None)
+            self._store(key, self._wrap(value, None))
 
 
     def replace(self, new_dict: dict):
@@ -224,32 +500,336 @@ class ConfigNode:
 
             # all valid → replace now
             self._data.clear()
+            if self._pending:
+                self._pending.clear()
             for key, value in new_dict.items():
-                rule = self._schema[key]
-                self._data[key] = self._wrap(value, rule)
+                self._data[key] = self._build(value, self._schema[key])
+            self._record("replace", (), self._data)
             return
 
         # free mode
         self._data = {k: self._wrap(v, None) for k, v in new_dict.items()}
+        if self._pending:
+            self._pending.clear()
+        self._record("replace", (), self._data)
+
+
+    # ---------------------------------------------------------
+    # IN-PLACE SYNC (incremental reload)
+    # ---------------------------------------------------------
+    def _sync(self, new: dict, path: str = "", changes: list | None = None) -> list[Change]:
+        """
+        Update this node in place so it matches the plain dict `new`.
+        Unchanged subtrees keep their identity; returns the list of changes.
+        """
+        if changes is None:
+            changes = []
+        data = self._data
+        pending = self._pending
+        schema = self._schema
+
+        for key in [k for k in data if k not in new]:
+            changes.append(Change(_join(path, key), "removed", _plain(data[key]), None))
+            self._remove(key)
+
+        for key, value in new.items():
+            sub = _join(path, key)
+            rule = schema.get(key) if schema is not None else None
+
+            if key not in data:
+                self._store(key, self._wrap(value, rule))
+                changes.append(Change(sub, "added", None, _plain(value)))
+                continue
+
+            current = data[key]
+
+            # not materialized yet → diff the raw values, keep it pending
+            if pending and key in pending:
+                if isinstance(current, dict) and isinstance(value, dict):
+                    _diff_dicts(current, value, sub, changes)
+                elif not _same(current, value):
+                    changes.append(Change(sub, "changed", _plain(current), _plain(value)))
+                if current != value:
+                    data[key] = value
+                    self._record("replace", (key,), value)
+                continue
+
+            if isinstance(current, ConfigNode) and isinstance(value, dict):
+                if rule is not None:
+                    rule.validate(value)
+                current._sync(value, sub, changes)
+                continue
+
+            old = _plain(current)
+            if not _same(old, value):
+                self._store(key, self._wrap(value, rule))
+                changes.append(Change(sub, "changed", old, _plain(value)))
+
+        return changes
+
+    # ---------------------------------------------------------
+    # MUTATION JOURNAL / JSON PATCH
+    # ---------------------------------------------------------
+    def _root(self):
+        node = self
+        while node._parent is not None:
+            node = node._parent
+        return node
+
+    def enable_journal(self) -> int:
+        """Start recording mutations on the root of this tree; returns the current token."""
+        root = self._root()
+        if root._journal is None:
+            object.__setattr__(root, "_journal", Journal())
+        return root._journal.token
+
+    def journal_token(self) -> int:
+        """Token for "now"; changes_since(token) later returns newer mutations."""
+        return self._journal_or_raise().token
+
+    def changes_since(self, token: int = 0) -> list[JournalEntry]:
+        """Mutations recorded at or after token, oldest first."""
+        return self._journal_or_raise().since(token)
+
+    def to_json_patch(self, token: int = 0) -> list[dict]:
+        """Mutations since token as an RFC 6902 JSON Patch."""
+        return [entry.to_json_patch() for entry in self.changes_since(token)]
+
+    def _journal_or_raise(self) -> Journal:
+        journal = self._root()._journal
+        if journal is None:
+            raise RuntimeError("Journal not enabled. Call enable_journal() first.")
+        return journal
+
+    def apply_patch(self, patch):
+        """
+        Apply a JSON Patch (list of {"op", "path", "value"} dicts) or a list of
+        JournalEntry to this node as one batch: the operations are first
+        checked and applied in order on a scratch copy (so each one sees the
+        result of the earlier ones), and only applied to this tree if every
+        one succeeded. Supported ops: add, replace, remove, test.
+        """
+        ops = []
+        for op in patch:
+            if isinstance(op, JournalEntry):
+                ops.append((op.op, tuple(op.parts), op.value))
+                continue
+            name = op["op"]
+            if name not in ("add", "replace", "remove", "test"):
+                raise ValueError(f"Unsupported patch operation: {name}")
+            ops.append((name, from_pointer(op["path"]), op.get("value")))
+
+        scratch = ConfigNode(self.to_dict(), self._schema)
+        for name, parts, value in ops:
+            scratch._check_op(name, parts, value)
+            if name != "test":
+                scratch._apply_op(name, parts, value)
+        for name, parts, value in ops:
+            if name != "test":
+                self._apply_op(name, parts, value)
+
+    def _check_op(self, name, parts, value):
+        """Raise if the op could not be applied to this tree."""
+        if not parts:
+            if name == "remove":
+                raise ValueError("Cannot remove the root of the config.")
+            if name != "test" and self._schema is not None:
+                errors = self._schema.validate_all(value)
+                if errors:
+                    raise errors[0]
+            return
+
+        node, rule = self, None
+        schema = self._schema
+        for i, p in enumerate(parts):
+            last = i == len(parts) - 1
+            if isinstance(node, list):
+                try:
+                    idx = len(node) if p == "-" else int(p)
+                except ValueError:
+                    raise ValueError(f"Invalid list index {p!r} in {to_pointer(parts)}") from None
+                if idx < 0 or idx > len(node) or (idx == len(node) and not (last and name == "add")):
+                    raise ValueError(f"List index {p!r} out of range in {to_pointer(parts)}")
+                child = node[idx] if idx < len(node) else _MISSING
+                rule = rule.item if rule is not None else None
+            else:
+                if schema is not None:
+                    if p not in schema:
+                        raise SchemaError(f"'{p}' is not allowed by the schema.", ".".join(map(str, parts)))
+                    rule = schema[p]
+                else:
+                    rule = None
+                if isinstance(node, ConfigNode) and p in node._data:
+                    child = node._child(p)
+                else:
+                    child = _MISSING
+            if last:
+                break
+            if isinstance(child, ConfigNode):
+                node, schema = child, child._schema
+            elif isinstance(child, list):
+                node, schema = child, None
+            else:
+                # missing → auto-created as a node, like set()
+                if rule is not None and not rule.container:
+                    raise SchemaError(
+                        f"Cannot auto-create '{p}' because schema expects primitive {rule.name}",
+                        ".".join(map(str, parts)),
+                    )
+                node, schema = None, rule.subschema if rule is not None else None
+
+        if name == "remove":
+            if child is _MISSING:
+                raise ValueError(f"Cannot remove missing path {to_pointer(parts)}")
+        elif name == "test":
+            if child is _MISSING or _plain(child) != value:
+                raise ValueError(f"Patch test failed at {to_pointer(parts)}")
+        elif rule is not None:
+            # deep check, like the root case: nested values are wrapped only when applied
+            errors = []
+            rule.collect(value, ".".join(map(str, parts)), errors)
+            if errors:
+                raise errors[0]
+
+    def _apply_op(self, name, parts, value):
+        if not parts:
+            self.replace(value)
+            return
+        owner, rel, node = self, (), self
+        for p in parts[:-1]:
+            if isinstance(node, list):
+                node = node[int(p)]
+                rel += (int(p),)
+            else:
+                child = node._child(p) if p in node._data else None
+                if not isinstance(child, (ConfigNode, list)):
+                    rule = node._schema[p] if node._schema is not None else None
+                    child = ConfigNode({}, rule.subschema if rule is not None else None,
+                                      node._pending is not None, node)
+                    node._store(p, child)
+                if isinstance(child, list):
+                    owner, rel = node, (p,)
+                node = child
+            if isinstance(node, ConfigNode):
+                owner, rel = node, ()
+
+        last = parts[-1]
+        if isinstance(node, ConfigNode):
+            if name == "remove":
+                node._remove(last)
+            else:
+                node[last] = value
+            return
 
+        # element of a list → edit it in place through its owning node
+        idx = len(node) if last == "-" else int(last)
+        if name == "remove":
+            del node[idx]
+        else:
+            # element rule: owner field → one .item per list level
+            rule = owner._schema.get(rel[0]) if owner._schema is not None else None
+            for _ in rel[1:]:
+                rule = rule.item if rule is not None else None
+            wrapped = owner._build(value, rule.item if rule is not None else None)
+            if name == "add":
+                node.insert(idx, wrapped)
+            else:
+                node[idx] = wrapped
+        owner._record(name, rel + (idx,), value)
+
+    # ---------------------------------------------------------
+    # BATCH VALIDATION
+    # ---------------------------------------------------------
+    def validate_all(self) -> list[SchemaError]:
+        """Check the whole tree and return every violation instead of raising."""
+        if self._schema is None:
+            return []
+        return self._schema.validate_all(self)
 
     # ---------------------------------------------------------
     # to_dict + iteration helpers
     # ---------------------------------------------------------
-    def to_dict(self):
+    def to_dict(self, copy: bool = True):
+        """
+        Plain dict of the tree. copy=False returns a dict cached per node
+        and generation: unchanged subtrees are reused between calls, so the
+        result is shared and must not be modified (in-place list changes
+        are not tracked, as for save()).
+        """
+        if not copy:
+            return self._cached_dict()
+
         def convert(v):
             if isinstance(v, ConfigNode):
                 return v.to_dict()
             if isinstance(v, list):
                 return [convert(x) for x in v]
+            # raw value of a not yet materialized (lazy) child
+            if isinstance(v, dict):
+                return {k: convert(x) for k, x in v.items()}
             return v
         return {k: convert(v) for k, v in self._data.items()}
 
-    def items(self): return self._data.items()
+    def _cached_dict(self):
+        cache = self._dict
+        if cache is not None and cache[0] == self._gen:
+            return cache[1]
+
+        def convert(v):
+            if isinstance(v, ConfigNode):
+                return v._cached_dict()
+            if isinstance(v, list):
+                return [convert(x) for x in v]
+            if isinstance(v, dict):
+                return {k: convert(x) for k, x in v.items()}
+            return v
+        d = {k: convert(v) for k, v in self._data.items()}
+        object.__setattr__(self, "_dict", (self._gen, d))
+        return d
+
+    def items(self):
+        self._materialize()
+        return self._data.items()
+
     def keys(self): return self._data.keys()
-    def values(self): return self._data.values()
+
+    def values(self):
+        self._materialize()
+        return self._data.values()
 
     def __iter__(self): return iter(self._data)
     def __len__(self): return len(self._data)
     def __repr__(self): return f"ConfigNode({self._data})"
     def __dir__(self): return list(super().__dir__()) + list(self._data.keys())
+
+
+class ConfigPath:
+    """
+    A dotted path compiled once against a node.
+    The key is split a single time and get() returns a cached value
+    until the node (or anything below it) is mutated.
+    """
+    __slots__ = ("node", "key", "parts", "_cache")
+
+    def __init__(self, node: ConfigNode, dotted_key: str):
+        self.node = node
+        self.key = dotted_key
+        self.parts = tuple(dotted_key.split("."))
+        self._cache = None
+
+    def get(self, default=None):
+        node = self.node
+        cache = self._cache
+        if cache is not None and cache[0] == node._gen:
+            return cache[1]
+        value = node._walk(self.parts)
+        if value is _MISSING:
+            return default
+        self._cache = (node._gen, value)
+        return value
+
+    def set(self, value):
+        self.node._set_parts(self.parts, value)
+
+    def __repr__(self):
+        return f"ConfigPath({self.key!r})"
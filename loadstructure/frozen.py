@@ -0,0 +1,244 @@
+"""
+Immutable config trees.
+
+A FrozenNode never changes after it is built: nested mappings are
+FrozenNodes, lists become tuples, and missing keys raise instead of being
+auto-created. Reading one needs no lock, so a tree can be shared freely
+between threads (ConfigManager.snapshot() hands them out to readers).
+
+Trees are persistent: with_() and evolve() return a new tree that copies
+only the nodes on the changed paths and shares every other subtree with
+the original. Nodes are hashable (hash cached per node), so derived
+configs can be used as memoization keys; equality short-circuits on
+shared subtrees.
+"""
+from loadstructure.config_node import ConfigNode
+
+_MISSING = object()
+
+
+def freeze(value, base=None):
+    """
+    Immutable copy of value: dicts/ConfigNodes → FrozenNode, lists → tuples.
+    Subtrees equal to the matching subtree of `base` (a previous frozen
+    version) are reused instead of copied.
+    """
+    if isinstance(value, FrozenNode):
+        return value
+    if isinstance(value, ConfigNode):
+        # walk the node's own dict: no plain copy of the tree
+        value = value._data
+    if isinstance(value, dict):
+        if not isinstance(base, FrozenNode):
+            return FrozenNode._of({k: freeze(v) for k, v in value.items()})
+        old = base._data
+        data = {k: freeze(v, old.get(k)) for k, v in value.items()}
+        if len(data) == len(old) and all(
+            k in old and old[k] is v for k, v in data.items()
+        ):
+            return base
+        return FrozenNode._of(data)
+    if isinstance(value, (list, tuple)):
+        frozen = tuple(freeze(v) for v in value)
+        return base if type(base) is tuple and base == frozen else frozen
+    if isinstance(value, set):
+        return frozenset(value)
+    if type(base) is type(value) and base == value:
+        return base
+    return value
+
+
+def _unchanged(old, new) -> bool:
+    if old is new:
+        return True
+    # scalars/tuples: cheap equality; nodes: only identity counts as unchanged
+    return (type(old) is type(new) and not isinstance(new, FrozenNode)
+            and old == new)
+
+
+def thaw(value):
+    """Plain mutable copy: FrozenNode → dict, tuples → lists."""
+    if isinstance(value, FrozenNode):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+    return value
+
+
+class FrozenNode:
+    """Read-only ConfigNode counterpart: attribute, item and dotted-path reads."""
+    __slots__ = ("_data", "_hash")
+
+    def __init__(self, d=None):
+        object.__setattr__(self, "_data", {k: freeze(v) for k, v in (d or {}).items()})
+        object.__setattr__(self, "_hash", None)
+
+    @classmethod
+    def _of(cls, data: dict) -> "FrozenNode":
+        """Wrap a dict whose values are already frozen (no copy)."""
+        node = object.__new__(cls)
+        object.__setattr__(node, "_data", data)
+        object.__setattr__(node, "_hash", None)
+        return node
+
+    # ---------------------------------------------------------
+    # READS
+    # ---------------------------------------------------------
+    def __getattr__(self, key):
+        if key.startswith("__"):
+            raise AttributeError(key)
+        try:
+            return self._data[key]
+        except KeyError:
+            raise AttributeError(f"'{key}' is not set (snapshots are read-only)") from None
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def get(self, dotted_key, default=None):
+        node = self
+        for p in dotted_key.split("."):
+            if not isinstance(node, FrozenNode):
+                return default
+            node = node._data.get(p, _MISSING)
+            if node is _MISSING:
+                return default
+        return node
+
+    def get_many(self, paths, default=None) -> dict:
+        return {p: self.get(p, default) for p in paths}
+
+    # ---------------------------------------------------------
+    # DERIVED VERSIONS (path copying)
+    # ---------------------------------------------------------
+    def with_(self, dotted_key: str, value) -> "FrozenNode":
+        """
+        New tree with dotted_key set to value (missing parents are created).
+        Only the nodes along the path are copied; returns self if unchanged.
+        """
+        return self._with(dotted_key.split("."), freeze(value))
+
+    def _with(self, parts, value):
+        key = parts[0]
+        current = self._data.get(key, _MISSING)
+        if len(parts) == 1:
+            new = value
+        else:
+            child = current if isinstance(current, FrozenNode) else _EMPTY
+            new = child._with(parts[1:], value)
+        if current is not _MISSING and _unchanged(current, new):
+            return self
+        data = dict(self._data)
+        data[key] = new
+        return FrozenNode._of(data)
+
+    def evolve(self, changes: dict | None = None, **kwargs) -> "FrozenNode":
+        """
+        New tree with changes deep-merged in: nested dicts update the
+        matching subtrees key by key, other values replace. Keys may be
+        dotted paths ({"limits.api.burst": 50}). Untouched subtrees are
+        shared with this tree; returns self if nothing changed.
+        """
+        nested = {}
+        for dotted_key, value in {**(changes or {}), **kwargs}.items():
+            parts = dotted_key.split(".")
+            target = nested
+            for p in parts[:-1]:
+                nxt = target.get(p)
+                if not isinstance(nxt, dict):
+                    nxt = target[p] = {}
+                target = nxt
+            last = parts[-1]
+            if isinstance(value, dict) and isinstance(target.get(last), dict):
+                _merge_plain(target[last], value)
+            else:
+                target[last] = value
+        return self._evolve(nested)
+
+    def _evolve(self, changes: dict):
+        data = None
+        for key, value in changes.items():
+            current = self._data.get(key, _MISSING)
+            if type(value) is dict and isinstance(current, FrozenNode):
+                new = current._evolve(value)
+            else:
+                new = freeze(value)
+            if current is not _MISSING and _unchanged(current, new):
+                continue
+            if data is None:
+                data = dict(self._data)
+            data[key] = new
+        return self if data is None else FrozenNode._of(data)
+
+    # ---------------------------------------------------------
+    # HASHING + EQUALITY (cached / shared-subtree aware)
+    # ---------------------------------------------------------
+    def __hash__(self):
+        h = self._hash
+        if h is None:
+            h = hash(frozenset(self._data.items()))
+            object.__setattr__(self, "_hash", h)
+        return h
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, FrozenNode):
+            return NotImplemented
+        if (self._hash is not None and other._hash is not None
+                and self._hash != other._hash):
+            return False
+        # children compare by identity first → shared subtrees are free
+        return self._data == other._data
+
+    # ---------------------------------------------------------
+    # NO WRITES
+    # ---------------------------------------------------------
+    def __setattr__(self, key, value):
+        raise TypeError("FrozenNode is read-only")
+
+    def __delattr__(self, key):
+        raise TypeError("FrozenNode is read-only")
+
+    def __setitem__(self, key, value):
+        raise TypeError("FrozenNode is read-only")
+
+    # immutable → copies are the node itself
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (FrozenNode._of, (self._data,))
+
+    # ---------------------------------------------------------
+    # to_dict + iteration helpers
+    # ---------------------------------------------------------
+    def to_dict(self):
+        return {k: thaw(v) for k, v in self._data.items()}
+
+    def thaw(self) -> ConfigNode:
+        """Mutable ConfigNode copy."""
+        return ConfigNode(self.to_dict())
+
+    def items(self): return self._data.items()
+    def keys(self): return self._data.keys()
+    def values(self): return self._data.values()
+    def __contains__(self, key): return key in self._data
+    def __iter__(self): return iter(self._data)
+    def __len__(self): return len(self._data)
+    def __repr__(self): return f"FrozenNode({self._data})"
+    def __dir__(self): return list(super().__dir__()) + list(self._data.keys())
+
+
+def _merge_plain(a: dict, b: dict):
+    for k, v in b.items():
+        if isinstance(v, dict) and isinstance(a.get(k), dict):
+            _merge_plain(a[k], v)
+        else:
+            a[k] = v
+
+
+_EMPTY = FrozenNode._of({})
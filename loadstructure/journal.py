@@ -0,0 +1,73 @@
+from typing import Any, NamedTuple
+
+
+class JournalEntry(NamedTuple):
+    """One recorded mutation: op is "add", "replace" or "remove"."""
+    seq: int
+    op: str
+    parts: tuple
+    value: Any
+
+    @property
+    def path(self) -> str:
+        """Dotted path of the mutated key ("" for the root)."""
+        return ".".join(str(p) for p in self.parts)
+
+    def to_json_patch(self) -> dict:
+        """RFC 6902 operation for this entry."""
+        if self.op == "remove":
+            return {"op": "remove", "path": to_pointer(self.parts)}
+        return {"op": self.op, "path": to_pointer(self.parts), "value": self.value}
+
+
+class Journal:
+    """
+    Append-only list of JournalEntry. Tokens are sequence numbers:
+    changes_since(token) returns every entry recorded at or after token.
+    """
+    __slots__ = ("entries", "base")
+
+    def __init__(self):
+        self.entries = []
+        # seq of entries[0]; grows when old entries are truncated
+        self.base = 0
+
+    @property
+    def token(self) -> int:
+        """Token for "now": pass it to since() later to get newer changes."""
+        return self.base + len(self.entries)
+
+    def append(self, op, parts, value):
+        self.entries.append(JournalEntry(self.token, op, parts, value))
+
+    def since(self, token: int = 0) -> list[JournalEntry]:
+        if token < self.base:
+            raise ValueError(
+                f"Journal was truncated at {self.base}; token {token} is too old."
+            )
+        return self.entries[token - self.base:]
+
+    def truncate(self, token: int):
+        """Drop entries older than token (they can no longer be replayed)."""
+        drop = max(0, min(token, self.token) - self.base)
+        del self.entries[:drop]
+        self.base += drop
+
+
+# ---------------------------------------------------------
+# JSON POINTER (RFC 6901)
+# ---------------------------------------------------------
+def to_pointer(parts) -> str:
+    return "".join(
+        "/" + str(p).replace("~", "~0").replace("/", "~1") for p in parts
+    )
+
+
+def from_pointer(pointer: str) -> tuple:
+    if pointer == "":
+        return ()
+    if not pointer.startswith("/"):
+        raise ValueError(f"Invalid JSON pointer: {pointer!r}")
+    return tuple(
+        p.replace("~1", "/").replace("~0", "~") for p in pointer[1:].split("/")
+    )
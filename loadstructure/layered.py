@@ -0,0 +1,239 @@
+class LayeredNode:
+    """
+    Read-through view over several config layers (like a recursive ChainMap).
+
+    Layers are plain dicts given lowest priority first, each with a source
+    name (usually the file it came from). `cfg.a.b.c` is resolved on demand
+    by checking the layers from the top down, nothing is copied, and the
+    source of every value can be queried. Writes go to a single write layer
+    (the top one by default), so shared base layers are never modified.
+
+    Sub-views (cfg.db) keep the root view and their path and resolve their
+    layers from the root on every access, so they see writes and pushes
+    made after they were created. Dicts inside lists are read-only views.
+    """
+    __slots__ = ("_root", "_path", "_layers", "_write")
+
+    def __init__(self, layers, write_to=None, _root=None, _path=()):
+        if _root is not None:
+            object.__setattr__(self, "_root", _root)
+            object.__setattr__(self, "_path", _path)
+            return
+        # [(source, dict)] highest priority first
+        ordered = [
+            layer if isinstance(layer, tuple) else (f"layer{i}", layer)
+            for i, layer in enumerate(layers)
+        ][::-1]
+        object.__setattr__(self, "_root", self)
+        object.__setattr__(self, "_path", ())
+        object.__setattr__(self, "_layers", ordered)
+        object.__setattr__(self, "_write", None)
+        if ordered and write_to is not False:
+            object.__setattr__(self, "_write", self._find_layer(write_to))
+
+    def _view(self, key):
+        return LayeredNode(None, _root=self._root, _path=self._path + (key,))
+
+    def _current(self):
+        """[(source, dict)] of this view, highest priority first."""
+        layers = self._root._layers
+        for key in self._path:
+            sub = []
+            for source, data in layers:
+                if key not in data:
+                    continue
+                value = data[key]
+                if not isinstance(value, dict):
+                    if sub:
+                        break
+                    # shadowed by a plain value → nothing below it
+                    return []
+                sub.append((source, value))
+            layers = sub
+        return layers
+
+    # ---------------------------------------------------------
+    # LAYER MANAGEMENT
+    # ---------------------------------------------------------
+    def _find_layer(self, which):
+        """Top-level dict of a layer given by source name or index (None → top)."""
+        layers = self._root._layers
+        if which is None:
+            return layers[0][1]
+        if isinstance(which, int):
+            # index counts from the bottom like the constructor argument
+            return layers[::-1][which][1]
+        for source, data in layers:
+            if source == which:
+                return data
+        raise KeyError(f"No layer named {which!r}")
+
+    def push(self, source="runtime", data=None):
+        """Add a new top layer (empty by default) and make it the write layer."""
+        if self._path:
+            raise RuntimeError("push() is only available on the root view.")
+        data = {} if data is None else data
+        self._layers.insert(0, (source, data))
+        object.__setattr__(self, "_write", data)
+        return data
+
+    def layer(self, source):
+        """Return the raw dict of a layer."""
+        return self._find_layer(source)
+
+    @property
+    def sources(self) -> list:
+        """Layer sources from lowest to highest priority."""
+        return [source for source, _ in reversed(self._current())]
+
+    # ---------------------------------------------------------
+    # RESOLUTION
+    # ---------------------------------------------------------
+    def _lookup(self, key):
+        """
+        Return (found, value, source). Dict values become a LayeredNode of
+        every layer that has a dict at that key, down to the first layer
+        that shadows it with a non-dict value.
+        """
+        sub = None
+        for source, data in self._current():
+            if key not in data:
+                continue
+            value = data[key]
+            if not isinstance(value, dict):
+                if sub:
+                    break
+                if isinstance(value, list):
+                    value = _wrap_list(value, source)
+                return True, value, source
+            sub = sub or source
+        if sub is None:
+            return False, None, None
+        return True, self._view(key), sub
+
+    def __getattr__(self, key):
+        if key.startswith("__"):
+            raise AttributeError(key)
+        found, value, _ = self._lookup(key)
+        if found:
+            return value
+        # missing → empty view, created in the write layer on first write
+        return self._view(key)
+
+    def __getitem__(self, key):
+        return self.__getattr__(key)
+
+    def get(self, dotted_key, default=None):
+        node = self
+        for p in dotted_key.split("."):
+            if not isinstance(node, LayeredNode):
+                return default
+            found, node, _ = node._lookup(p)
+            if not found:
+                return default
+        return node
+
+    # ---------------------------------------------------------
+    # PROVENANCE
+    # ---------------------------------------------------------
+    def source(self, dotted_key):
+        """Source of the layer that supplies dotted_key (None if unset)."""
+        parts = dotted_key.split(".")
+        node = self
+        for p in parts[:-1]:
+            found, node, _ = node._lookup(p)
+            if not found or not isinstance(node, LayeredNode):
+                return None
+        return node._lookup(parts[-1])[2]
+
+    def provenance(self) -> dict:
+        """Map every leaf dotted path to the source that supplies it."""
+        out = {}
+
+        def walk(node, prefix):
+            for key in node.keys():
+                _, value, source = node._lookup(key)
+                path = f"{prefix}.{key}" if prefix else key
+                if isinstance(value, LayeredNode):
+                    walk(value, path)
+                else:
+                    out[path] = source
+        walk(self, "")
+        return out
+
+    # ---------------------------------------------------------
+    # WRITES (write layer only)
+    # ---------------------------------------------------------
+    def _write_target(self, path):
+        data = self._root._write
+        if data is None:
+            raise RuntimeError("No writable layer.")
+        for p in path:
+            nxt = data.get(p)
+            if not isinstance(nxt, dict):
+                nxt = data[p] = {}
+            data = nxt
+        return data
+
+    def __setattr__(self, key, value):
+        self._write_target(self._path)[key] = value
+
+    def __setitem__(self, key, value):
+        self.__setattr__(key, value)
+
+    def set(self, dotted_key: str, value):
+        parts = dotted_key.split(".")
+        self._write_target(self._path + tuple(parts[:-1]))[parts[-1]] = value
+
+    # ---------------------------------------------------------
+    # to_dict + iteration helpers
+    # ---------------------------------------------------------
+    def to_dict(self):
+        """Flattened copy of the resolved view."""
+        out = {}
+        for key in self.keys():
+            out[key] = _plain(self._lookup(key)[1])
+        return out
+
+    def keys(self):
+        # lowest layer first, like the key order of a merge
+        keys = {}
+        for _, data in reversed(self._current()):
+            keys.update(dict.fromkeys(data))
+        return keys.keys()
+
+    def items(self):
+        return [(k, self._lookup(k)[1]) for k in self.keys()]
+
+    def values(self):
+        return [self._lookup(k)[1] for k in self.keys()]
+
+    def __contains__(self, key):
+        return any(key in data for _, data in self._current())
+
+    def __iter__(self): return iter(self.keys())
+    def __len__(self): return len(self.keys())
+    def __dir__(self): return list(super().__dir__()) + list(self.keys())
+
+    def __repr__(self):
+        return f"LayeredNode({self.sources}, {self.to_dict()})"
+
+
+def _wrap_list(value, source):
+    """Copy of a list with its dicts as read-only single-layer views."""
+    if not any(isinstance(v, (dict, list)) for v in value):
+        return value
+    return [
+        LayeredNode([(source, v)], write_to=False) if isinstance(v, dict)
+        else _wrap_list(v, source) if isinstance(v, list)
+        else v
+        for v in value
+    ]
+
+
+def _plain(value):
+    if isinstance(value, LayeredNode):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    return value
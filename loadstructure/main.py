@@ -1,120 +1,421 @@
-from loadstructure.config_node import ConfigNode
-from loadstructure.utils.helper import _merge_dicts
-import json
-import yaml
-import xmltodict
+from loadstructure.cache import MISS, ParseCache, resolve_cache
+from loadstructure.codec import extensions, get_codec
+from loadstructure.config_node import Change, ConfigNode
+from loadstructure.frozen import FrozenNode, freeze
+from loadstructure.layered import LayeredNode
+from loadstructure.pool import ConfigPool, default_pool
+from loadstructure import stats as _stats
+from loadstructure.schema import SchemaError, compile_schema
+from loadstructure.shared import SharedPublisher, SharedSubscriber
+from loadstructure.stats import NULL_TIMER, Stats
+from loadstructure.stream import build_selection, extract, select_json, select_xml, select_yaml
+from loadstructure.utils.helper import _expand_paths, _merge_into
+from loadstructure.watcher import WatchHandle, watch_file
 import os
-import configparser
-import tomllib
-import toml   
-import time 
+import mmap
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+import asyncio
+import functools
+import inspect
+import logging
+import stat
 import threading
 
+logger = logging.getLogger("loadstructure")
+
+# files at least this large are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 1 << 20
+# first non-whitespace byte; searching the buffer avoids a stripped copy
+_NON_SPACE = re.compile(rb"\S")
+
+
+def _create_temp(directory: str, name: str):
+    """
+    Open a new temp file next to `name` with mode 0666, so the kernel
+    applies the process umask like for any newly created file.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_CLOEXEC", 0)
+    for _ in range(100):
+        tmp = os.path.join(directory, f".{name}.{os.urandom(6).hex()}.tmp")
+        try:
+            return os.open(tmp, flags, 0o666), tmp
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"Could not create a temp file in {directory}")
+
+
+def _write_atomic(path: str, write):
+    """
+    Write a text file through a temp file in the same directory:
+    write → flush → fsync → rename over path → fsync directory.
+    Keeps the permissions of an existing file.
+    """
+    # symlinked config → replace the file it points to, not the link
+    path = os.path.realpath(path)
+    directory = os.path.dirname(path)
+    fd, tmp = _create_temp(directory, os.path.basename(path))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            # new file → keep the umask-derived mode of the temp file
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    # make the rename itself durable (best effort, not supported everywhere)
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def _parse_file(path: str):
+    """Parse one file into plain data (module level so process pools can pickle it)."""
+    return ConfigManager(path)._read_raw()
+
+
+def _parse_many(paths, jobs=None, processes=False):
+    """Expand paths/globs/directories and parse the files concurrently, in order."""
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    files = _expand_paths(paths, extensions())
+    if not files:
+        raise ValueError(f"No config files matched: {paths}")
+
+    if jobs is None:
+        jobs = min(32, len(files), (os.cpu_count() or 1) + 4)
+    if jobs <= 1 or len(files) == 1:
+        return files, [_parse_file(f) for f in files]
+    pool_cls = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with pool_cls(max_workers=jobs) as pool:
+        return files, list(pool.map(_parse_file, files))
+
 
 class ConfigManager:
     """Load JSON/YAML/XML/TOML configs and provide attribute-style access."""
 
-    def __init__(self, path: str, filetype: str = None, schema: dict | None = None):
+    def __init__(self, path: str, filetype: str = None, schema: dict | None = None,
+                 lazy: bool = False, cache: "bool | str | ParseCache | None" = None,
+                 executor: Executor | None = None, journal: bool = False,
+                 instrument: bool = False, hook=None):
         self.path:str = path
         self.filetype:str = filetype
         self._config: ConfigNode | None = None
-        self._schema:dict = schema
+        # compiled once; ConfigNode reuses the compiled rule tree
+        self._schema = compile_schema(schema) if schema is not None else None
+        # lazy → nested values are wrapped/validated on first access
+        self._lazy:bool = lazy
+        self._last_changes: list[Change] = []
+        # on-disk parse cache: None/False → off, True → default dir, str → dir
+        self._cache: ParseCache | None = resolve_cache(cache)
+        # thread pool used by the async API (None → loop default)
+        self._executor: Executor | None = executor
+        # record mutations of the loaded tree (changes_since / to_json_patch)
+        self._journal:bool = journal
+        # (config, generation, path, ext) as of the last load/reload/save
+        self._clean: tuple | None = None
+        # selection of load(only=...), reused by reload(); None → whole file
+        self._only: dict | None = None
+        # (config, generation, version, FrozenNode) served by snapshot(); replaced
+        # as a whole so readers never need a lock; None until first requested
+        self._snapshot: tuple | None = None
+        # serializes load/reload/publish (writers only)
+        self._write_lock = threading.RLock()
+        # True while load/reload swap in a tree; snapshot() then serves the
+        # published snapshot instead of waiting for the lock
+        self._swapping = False
+        # phase timings/counters (see loadstructure.stats); None → off
+        self._stats: Stats | None = None
+        if instrument or hook is not None:
+            self._stats = Stats(hook)
+            _stats.enable()
+
+    # ---------- instrumentation ----------
+    def _timer(self, name: str):
+        stats = self._stats
+        return NULL_TIMER if stats is None else stats.timer(name)
+
+    def _count(self, name: str, n: int = 1):
+        if self._stats is not None:
+            self._stats.count(name, n)
+
+    def _tree_phase(self, name: str, fn, *args):
+        """
+        Run a tree-building step; with instrumentation on, its time is split
+        into `name` and "validate", and nodes/validations are counted.
+        """
+        stats, counters = self._stats, _stats.node_counters
+        if stats is None or counters is None:
+            with self._timer(name):
+                return fn(*args)
+        nodes, checks, spent = (
+            counters.nodes_created, counters.validations, counters.validate_seconds
+        )
+        start = _stats.perf_counter()
+        result = fn(*args)
+        elapsed = _stats.perf_counter() - start
+        validate = counters.validate_seconds - spent
+        stats.add_time(name, elapsed - validate)
+        if counters.validations != checks:
+            stats.add_time("validate", validate)
+            stats.count("validations", counters.validations - checks)
+        stats.count("nodes_created", counters.nodes_created - nodes)
+        return result
+
+    def stats(self) -> dict:
+        """
+        Instrumentation snapshot (needs instrument=True or hook=...):
+        {"phases": {name: {"calls", "total", "max", "last"}},
+         "counters": {...}, "process": {process-wide node counters}}
+        """
+        if self._stats is None:
+            return {"phases": {}, "counters": {}, "process": _stats.counters()}
+        return self._stats.snapshot()
+
+    def _new_tree(self, raw) -> ConfigNode:
+        node = self._tree_phase("wrap", ConfigNode, raw, self._schema, self._lazy)
+        if self._journal:
+            node.enable_journal()
+        return node
     
-    # ---------- loaders ----------
-    def _load_json(self):
-        with open(self.path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-
-    def _load_yaml(self):
-        if yaml is None:
-            raise ImportError("PyYAML is not installed. Run `uv add PyYAML`.")
-        with open(self.path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
-
-    def _load_xml(self):
-        if xmltodict is None:
-            raise ImportError("xmltodict is not installed. Run `uv add xmltodict`.")
-        with open(self.path, 'r', encoding='utf-8') as f:
-            xml = xmltodict.parse(f.read())
-        # Flatten root element if only one top-level key
-        if len(xml) == 1:
-            return list(xml.values())[0]
-        return xml
-    def _load_toml(self):
-        with open(self.path, "rb") as f:
-            if hasattr(tomllib, "load"):
-                data = tomllib.load(f)  # Python 3.11
-            else:
-                data = toml.load(f)  # toml package
-        return data
-    def _load_def(self):
-        parser = configparser.ConfigParser()
-        parser.read(self.path, encoding="utf-8")
-        data = {}
-        for section in parser.sections():
-            data[section] = {}
-            for key, value in parser.items(section):
-                # Try to auto-cast int, float, bool if possible
-                data[section][key] = self._cast_value(value)
-        return data
-
-    def _cast_value(self, value: str):
-        # Try bool
-        if value.lower() in ("true", "yes", "1"):
-            return True
-        if value.lower() in ("false", "no", "0"):
-            return False
-        # Try int
-        try:
-            return int(value)
-        except ValueError:
-            pass
-        # Try float
-        try:
-            return float(value)
-        except ValueError:
-            pass
-        # Return as string
-        return value
+    # ---------- pooled instances ----------
+    @classmethod
+    def open(cls, path: str, filetype: str = None, schema: dict | None = None,
+             lazy: bool = False, pool: ConfigPool | None = None, **kwargs) -> "ConfigManager":
+        """
+        Shared, already loaded manager for path from a process-wide pool
+        (see loadstructure.pool): no re-parse while the file is unchanged,
+        one load for concurrent first opens, LRU eviction. Other kwargs
+        only apply when the pooled manager is first created.
+        """
+        return (pool or default_pool()).open(cls, path, filetype, schema, lazy, **kwargs)
 
     # ---------- load main ----------
-    def load(self):
-        if not os.path.exists(self.path):
+    def load(self, only: list[str] | str | None = None):
+        """
+        Parse the file and return the ConfigNode.
+        only = dotted paths of the sections to load, e.g. ["modules.export"];
+        JSON/YAML/XML are then scanned without building the other branches
+        (see loadstructure.stream). reload() keeps the same selection.
+        """
+        with self._timer("load"):
+            self._only = build_selection(only) if only else None
+            raw = self._read_raw()
+            snap = self._snapshot
+            frozen = freeze(raw, snap[3]) if snap is not None else None
+            with self._write_lock:
+                self._swapping = True
+                try:
+                    # Wrap in ConfigNode
+                    self._config = self._new_tree(raw)
+                    self._mark_clean(self.path, self._ext())
+                    if frozen is not None:
+                        self._publish(frozen)
+                finally:
+                    self._swapping = False
+        self._count("loads")
+        return self._config
+
+    def _ext(self) -> str:
+        """Format of self.path: forced filetype or the extension."""
+        ext = (self.filetype or os.path.splitext(self.path)[1]).lower()
+        if ext and not ext.startswith("."):
+            ext = "." + ext
+        return ext
+
+    def _read_buffer(self):
+        """
+        Read the whole file exactly once.
+        Files of MMAP_THRESHOLD bytes or more are memory-mapped instead of copied.
+        Returns (buffer, stat result); a missing file is created and yields (b"", None).
+        """
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
             with open(self.path, 'w') as f:
                 pass
-        ext = os.path.splitext(self.path)[1].lower()
-        # Read raw text to detect empty file
-        with open(self.path, "r", encoding="utf-8") as f:
-            content = f.read().strip()
-
-        # If file is empty → treat as empty dict
-        if content == "":
-            raw = {}
-        else:
+            return b"", None
+        with f:
+            st = os.fstat(f.fileno())
+            if st.st_size >= MMAP_THRESHOLD:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), st
+            return f.read(), st
+
+    def _read_raw(self):
+        """Parse the file into plain Python data (empty file → {})."""
+        with self._timer("read"):
+            buf, st = self._read_buffer()
+        try:
+            # If file is empty (or whitespace only) → treat as empty dict
+            if _NON_SPACE.search(buf) is None:
+                return {}
+
             # If filetype argument is forced, use that
             if self.filetype is not None:
-                raw = self.select_filetype(self.filetype)
+                parser = self.filetype
             else:
-                raw = self.select_filetype(ext)
+                parser = os.path.splitext(self.path)[1].lower()
 
-        # Wrap in ConfigNode
-        self._config = ConfigNode(raw, self._schema)
-        return self._config
+            if self._only is not None:
+                with self._timer("parse"):
+                    return self._select(parser, buf)
+
+            cache = self._cache
+            if cache is not None:
+                with self._timer("parse"):
+                    raw = cache.get(self.path, parser, st, buf)
+                if raw is not MISS:
+                    self._count("cache_hits")
+                    return raw
+                self._count("cache_misses")
+
+            with self._timer("parse"):
+                raw = self.select_filetype(parser, buf)
+            if cache is not None:
+                cache.put(self.path, parser, st, buf, raw)
+            return raw
+        finally:
+            if isinstance(buf, mmap.mmap):
+                buf.close()
     
-    def select_filetype(self, ext: str):
-        if ext and not ext.startswith("."):
-            ext = "." + ext
-        match ext.lower():
-            case ".json": return self._load_json()
-            case ".yaml" | ".yml": return self._load_yaml()
-            case ".xml": return self._load_xml()
-            case ".def": return self._load_def()
-            case ".toml": return self._load_toml()
-            case _: raise ValueError(f"Unsupported file type: {ext}")
+    def _select(self, ext: str, buf):
+        """Parse only the selected subtrees (uncached: entries hold whole files)."""
+        match get_codec(ext).name:
+            case "json": return select_json(buf, self._only)
+            case "yaml": return select_yaml(buf, self._only)
+            case "xml": return select_xml(buf, self._only)
+            # no event parser → parse completely and trim
+            case _: return extract(self.select_filetype(ext, buf), self._only)
+
+    def select_filetype(self, ext: str, buf=None):
+        """Parse buf (default: the file) with the codec registered for ext."""
+        codec = get_codec(ext)
+        if codec.load is None:
+            raise ValueError(f"Codec {codec.name!r} cannot load files")
+        if buf is None:
+            buf, _ = self._read_buffer()
+        return codec.load(buf)
     # ---------------- reload -------------------------
     def reload(self):
-        self.load()
+        """
+        Re-read the file and update the loaded tree in place.
+        Only changed subtrees are replaced, so references to unchanged
+        nodes stay valid; the differences are kept in `last_changes`.
+        """
+        with self._timer("reload"):
+            return self._apply_reload(self._read_raw())
+
+    def _apply_reload(self, raw):
+        self._count("reloads")
+        # readers keep using the previous snapshot until the new one is swapped in;
+        # unchanged subtrees are shared with it
+        snap = self._snapshot
+        frozen = freeze(raw, snap[3]) if snap is not None else None
+        with self._write_lock:
+            if self._config is not None and isinstance(raw, dict) and self._schema is not None:
+                # validate everything first so a bad file never half-applies
+                # (lazy mode too: _sync would otherwise fail midway)
+                with self._timer("validate"):
+                    errors = self._schema.validate_all(raw, strict=False)
+                if errors:
+                    raise errors[0]
+            self._swapping = True
+            try:
+                if self._config is None or not isinstance(raw, dict):
+                    self._last_changes = []
+                    self._config = self._new_tree(raw)
+                else:
+                    self._last_changes = self._tree_phase("sync", self._config._sync, raw)
+                self._mark_clean(self.path, self._ext())
+                if frozen is not None:
+                    self._publish(frozen)
+            finally:
+                self._swapping = False
         return self._config
+
+    # ---------- snapshots ----------
+    def snapshot(self) -> FrozenNode:
+        """
+        Immutable view of the config for readers: no locks, no auto-created
+        keys, consistent across any number of reads. reload() (and watch())
+        publish a new snapshot with a single reference swap; holders of an
+        older snapshot keep reading it unchanged.
+        Changes made through the mutable tree show up in the next call.
+        """
+        snap = self._snapshot
+        config = self._config
+        if snap is not None and snap[0] is config and snap[1] == config._gen:
+            return snap[3]
+        if config is None:
+            raise RuntimeError("Config not loaded. Call load() first.")
+        # load/reload in progress → it publishes its own snapshot when done
+        if snap is not None and self._swapping:
+            return snap[3]
+        with self._write_lock:
+            # another caller may have re-frozen while this one waited
+            snap = self._snapshot
+            config = self._config
+            if snap is not None and snap[0] is config and snap[1] == config._gen:
+                return snap[3]
+            return self._publish(freeze(config, snap[3] if snap else None))
+
+    @property
+    def snapshot_version(self) -> int:
+        """Version of the current snapshot (0 before the first one)."""
+        snap = self._snapshot
+        return snap[2] if snap is not None else 0
+
+    def _publish(self, frozen: FrozenNode) -> FrozenNode:
+        """Swap in a new snapshot (write lock held)."""
+        snap = self._snapshot
+        if snap is not None and snap[3] is frozen:
+            # nothing changed (shared with the previous version) → same version
+            self._snapshot = (self._config, self._config._gen, snap[2], frozen)
+            return frozen
+        version = snap[2] + 1 if snap is not None else 1
+        self._snapshot = (self._config, self._config._gen, version, frozen)
+        self._count("snapshots")
+        return frozen
+
+    # ---------- shared memory (pre-fork workers) ----------
+    def share(self, name: str, watch: bool = True, replace: bool = False,
+              **watch_kwargs) -> SharedPublisher:
+        """
+        Publish snapshots of this config into shared memory under `name`
+        (now, and after every reload when watch=True; watch_kwargs go to
+        watch()). Call close() on the result to remove the segments.
+        A name another live process publishes raises FileExistsError
+        unless replace=True.
+        """
+        if self._config is None:
+            raise RuntimeError("Config not loaded. Call load() first.")
+        return SharedPublisher(self, name, watch, replace, **watch_kwargs)
+
+    @staticmethod
+    def attach(name: str, check_interval: float = 0.0) -> SharedSubscriber:
+        """Attach to snapshots published with share(); no parsing, no watcher."""
+        return SharedSubscriber(name, check_interval)
+
+    @property
+    def last_changes(self) -> list[Change]:
+        """Changes (dotted path, kind, old, new) applied by the last reload()."""
+        return self._last_changes
     
     # ---------- delegate attribute access ----------
     def __getattr__(self, name: str):
@@ -124,7 +425,7 @@ class ConfigManager:
     
     def __setattr__(self, name, value):
         # Allow normal attributes for internal variables
-        if name in ("path", "filetype", "_config"):
+        if name in ("path", "filetype") or name.startswith("_"):
             super().__setattr__(name, value)
         elif hasattr(self, "_config") and self._config is not None:
             setattr(self._config, name, value)
@@ -132,52 +433,189 @@ class ConfigManager:
             super().__setattr__(name, value)
     # -------- merging files -------------------------
     @classmethod
-    def merge(cls, paths: list[str]) -> "ConfigManager":
+    def merge(cls, paths: list[str] | str, jobs: int | None = None,
+              processes: bool = False, instrument: bool = False,
+              hook=None) -> "ConfigManager":
         """
-        Load and merge multiple config files (JSON/YAML/XML).
+        Load and merge multiple config files (JSON/YAML/XML/TOML/DEF).
+        paths may contain files, directories (every supported file, sorted
+        by name, conf.d style) and glob patterns such as "conf.d/*.yaml".
         Later files override earlier ones.
+        Files are parsed concurrently (jobs workers; threads by default,
+        processes=True for a process pool) and merged in one pass.
+        instrument/hook = record phase timings, see stats().
         Returns a ConfigManager instance with merged ConfigNode.
         """
-        merged_data = {}
-        for path in paths:
-            cm = cls(path)
-            cfg = cm.load()
-            merged_data = _merge_dicts(merged_data, cfg.to_dict())
-
-        # Create a ConfigManager without a path (or use first file as reference)
-        merged_manager = cls(paths[0])
-        merged_manager._config = ConfigNode(merged_data)
+        stats = Stats(hook) if instrument or hook is not None else None
+        if stats is not None:
+            _stats.enable()
+        timer = stats.timer if stats is not None else lambda name: NULL_TIMER
+
+        with timer("merge"):
+            with timer("parse"):
+                files, parsed = _parse_many(paths, jobs, processes)
+
+            # raw dicts are freshly parsed → merge in place, no wrap/unwrap round trip
+            with timer("merge_dicts"):
+                merged_data = {}
+                # copy-on-write: only dicts created by the merge are modified in place
+                owned = {id(merged_data)}
+                for path, raw in zip(files, parsed):
+                    if not isinstance(raw, dict):
+                        raise TypeError(f"Cannot merge {path}: top level is not a mapping")
+                    _merge_into(merged_data, raw, owned)
+
+            # Create a ConfigManager without a path (or use first file as reference)
+            merged_manager = cls(files[0])
+            merged_manager._stats = stats
+            merged_manager._config = merged_manager._tree_phase("wrap", ConfigNode, merged_data)
+        merged_manager._count("merges")
+        merged_manager._count("files_merged", len(files))
         return merged_manager
+
+    @classmethod
+    def overlay(cls, paths: list[str] | str, write_to=None, jobs: int | None = None) -> LayeredNode:
+        """
+        Load files as layers of a LayeredNode instead of merging them.
+        Nothing is copied: values are resolved top-down on access and
+        node.source("a.b") tells which file supplied a value.
+        write_to = file (or index) receiving writes; default is the last file.
+        """
+        files, parsed = _parse_many(paths, jobs)
+        layers = []
+        for path, raw in zip(files, parsed):
+            if not isinstance(raw, dict):
+                raise TypeError(f"Cannot layer {path}: top level is not a mapping")
+            layers.append((path, raw))
+        return LayeredNode(layers, write_to)
     
-    def watch(self, interval=1, on_reload=None):
+    def watch(self, interval=1, on_reload=None, debounce=0.1, backend="auto",
+              on_change=None) -> WatchHandle:
         """
         Auto reload the config file whenever it changes.
-        interval = check frequency (seconds)
+        interval = check frequency (seconds), only used by the polling backend
         on_reload = callback (function called after reload)
+        on_change = callback receiving the list of Change(path, kind, old, new),
+                    only called when something actually changed
+        Coroutine callbacks are awaited on the event loop watch() was called
+        from, and the reload itself then happens on that loop too.
+        debounce = quiet period (seconds) before a burst of writes triggers a reload
+        backend = "auto" (inotify on Linux, polling elsewhere), "inotify" or "poll"
+        Returns a WatchHandle; call handle.stop() to stop watching.
+        """
+
+        if inspect.iscoroutinefunction(on_reload) or inspect.iscoroutinefunction(on_change):
+            # async callbacks → reload and notify on the caller's event loop
+            loop = asyncio.get_running_loop()
+
+            def changed():
+                # never block the shared watcher thread on the loop
+                future = asyncio.run_coroutine_threadsafe(
+                    self._areload_notify(on_reload, on_change), loop
+                )
+                future.add_done_callback(self._log_failure)
+        else:
+            def changed():
+                self._count("watch_reloads")
+                self.reload()
+                if on_reload:
+                    on_reload(self)
+                if on_change and self._last_changes:
+                    on_change(self._last_changes)
+
+        return watch_file(self.path, changed, interval, debounce, backend)
+
+    # ---------- asyncio ----------
+    # File I/O and parsing run in self._executor (None → the loop's default
+    # thread pool); tree updates and callbacks happen on the event loop.
+    async def aload(self, only: list[str] | str | None = None):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(self.load, only))
+
+    async def areload(self):
+        """reload() with the read/parse step offloaded; the in-place sync runs on the loop."""
+        loop = asyncio.get_running_loop()
+        with self._timer("reload"):
+            raw = await loop.run_in_executor(self._executor, self._read_raw)
+            return self._apply_reload(raw)
+
+    async def asave(self, path: str | None = None, filetype: str | None = None) -> bool:
+        """Async save(); returns True if the file was written."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(self.save, path, filetype)
+        )
+
+    async def awatch(self, interval=1, debounce=0.1, backend="auto"):
         """
+        Async iterator over reloads: yields the list of Change entries each
+        time the file changes (reloads without changes are skipped).
 
-        def watcher():
-            last_mtime = os.path.getmtime(self.path)
+            async for changes in config.awatch():
+                ...
+        """
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        handle = watch_file(
+            self.path, lambda: loop.call_soon_threadsafe(event.set),
+            interval, debounce, backend,
+        )
+        try:
             while True:
-                time.sleep(interval)
+                await event.wait()
+                event.clear()
+                self._count("watch_reloads")
                 try:
-                    current_mtime = os.path.getmtime(self.path)
-                    if current_mtime != last_mtime:
-                        last_mtime = current_mtime
-                        self.reload()
-                        if on_reload:
-                            on_reload(self)
-                except FileNotFoundError:
-                    pass
-
-        thread = threading.Thread(target=watcher, daemon=True)
-        thread.start()
+                    await self.areload()
+                except Exception:
+                    logger.exception("reload of %s failed", self.path)
+                    continue
+                if self._last_changes:
+                    yield list(self._last_changes)
+        finally:
+            handle.stop()
+
+    def _log_failure(self, future):
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("reload of %s failed", self.path, exc_info=future.exception())
+
+    async def _areload_notify(self, on_reload, on_change):
+        self._count("watch_reloads")
+        await self.areload()
+        if on_reload:
+            result = on_reload(self)
+            if inspect.isawaitable(result):
+                await result
+        if on_change and self._last_changes:
+            result = on_change(self._last_changes)
+            if inspect.isawaitable(result):
+                await result
+
     # ---------- save back ----------
-    def save(self, path: str | None = None, filetype: str | None = None):
+    @property
+    def dirty(self) -> bool:
+        """True if the tree was mutated since the last load, reload or save."""
+        clean = self._clean
+        return (
+            self._config is not None
+            and (clean is None or clean[0] is not self._config or clean[1] != self._config._gen)
+        )
+
+    def _mark_clean(self, path: str, ext: str):
+        self._clean = (self._config, self._config._gen, os.path.abspath(path), ext)
+
+    def save(self, path: str | None = None, filetype: str | None = None, force: bool = False) -> bool:
+        """
+        Write the config atomically (temp file + fsync + rename), so readers
+        and watchers never see a partial file. The in-memory tree is kept.
+        The write is skipped when nothing changed since the file was last
+        loaded or saved; in-place changes to lists are not tracked, so pass
+        force=True (or assign the list again) after mutating one.
+        Returns True if the file was written.
+        """
         if self._config is None:
             raise RuntimeError("Nothing loaded to save.")
         path = path or self.path
-        data = self._config.to_dict()
         # Priority: given filetype > manager.filetype > path extension
         if filetype:
             ext = filetype.lower()
@@ -195,67 +633,57 @@ class ConfigManager:
         if os.path.splitext(path)[1] == "":
             path = path + ext
 
-        
-        if ext == ".json":
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
-        elif ext in (".yaml", ".yml"):
-            if yaml is None:
-                raise ImportError("PyYAML not installed. Run `uv add PyYAML`.")
-            with open(path, "w", encoding="utf-8") as f:
-                yaml.dump(data, f)
-        elif ext == ".xml":
-            if xmltodict is None:
-                raise ImportError("xmltodict not installed. Run `uv add xmltodict`.")
-            data = {"config": data}  # wrap all keys in root
-            with open(path, "w", encoding="utf-8") as f:
-                xmltodict.unparse(data, output=f, pretty=True)
-        elif ext == ".def":
-            self._save_def(path)
-        elif ext == ".toml":
-            self._save_toml(path)
-        else:
+        codec = get_codec(ext)
+        if codec.dump is None:
             raise ValueError(f"Unsupported save format: {ext}")
-        self.reload()
-    def _save_def(self, path: str):
-
-        if self._config is None:
-            raise RuntimeError("Nothing to save.")
 
-        parser = configparser.ConfigParser()
-        data = self._config.to_dict()
+        if self._only is not None and os.path.abspath(path) == os.path.abspath(self.path):
+            raise RuntimeError(
+                "Config was loaded with only=...; saving it over the source file "
+                "would drop every other section. Save to another path."
+            )
 
-        for section, values in data.items():
-            parser[section] = {}
-            for key, value in values.items():
-                # Convert booleans to 'true'/'false' strings
-                if isinstance(value, bool):
-                    parser[section][key] = "true" if value else "false"
-                else:
-                    parser[section][key] = str(value)
-
-        with open(path, "w", encoding="utf-8") as f:
-            parser.write(f)
-
-    def _save_toml(self, path: str):
-        if self._config is None:
-            raise RuntimeError("Nothing to save.")
-
-        data = self._config.to_dict()
+        # unchanged since the last load/save of this very file → nothing to do
+        if not force and not self.dirty and self._clean[2:] == (os.path.abspath(path), ext):
+            self._count("saves_skipped")
+            return False
 
-        with open(path, "w", encoding="utf-8") as f:
-            toml.dump(data, f)
+        with self._timer("save"):
+            if codec.dump_node is not None:
+                # serialized straight from the tree: no plain-dict copy
+                with self._timer("write"):
+                    _write_atomic(path, lambda f: codec.dump_node(self._config, f))
+            else:
+                with self._timer("to_dict"):
+                    data = self._config.to_dict(copy=False)
+                with self._timer("write"):
+                    _write_atomic(path, lambda f: codec.dump(data, f))
+            self._mark_clean(path, ext)
+        self._count("saves")
+        return True
 
     def __repr__(self):
         return self._config.__repr__()
     
-    def to_dict(self):
-        return self._config.to_dict()
+    def to_dict(self, copy: bool = True):
+        return self._config.to_dict(copy)
     
     def get(self, dotted_key, default=None):
         """Access using dotted path: node.get('a.b.c')"""
         return self._config.get(dotted_key, default)
     
+    def get_many(self, paths, default=None) -> dict:
+        """Read several dotted keys at once: {dotted key: value}."""
+        return self._config.get_many(paths, default)
+
+    def set_many(self, mapping: dict):
+        """Validate and then apply several dotted keys as one batch."""
+        self._config.set_many(mapping)
+
+    def validate_all(self) -> list[SchemaError]:
+        """Return every schema violation of the loaded config in one pass."""
+        return self._config.validate_all()
+
     def items(self):
         return self._config.items()
     
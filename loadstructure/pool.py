@@ -0,0 +1,217 @@
+"""
+Process-wide pool of loaded ConfigManagers (ConfigManager.open()).
+
+Repeated opens of the same file return the same, already loaded manager.
+Entries are revalidated with os.stat (mtime, size, inode) at most once per
+`revalidate_interval` seconds and reloaded in place when the file changed.
+The pool keeps at most `max_entries` managers and, optionally, an estimated
+`max_bytes` of config trees, evicting the least recently used first.
+Concurrent first opens of one file are coalesced into a single load.
+
+Pooled managers are shared by every caller: read through them (or their
+snapshot()) rather than mutating them.
+"""
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+from loadstructure.config_node import ConfigNode
+from loadstructure.schema import compile_schema, schema_key
+
+
+def _signature(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def estimate_size(value) -> int:
+    """Rough memory footprint of a config tree in bytes (containers + leaves)."""
+    size = sys.getsizeof(value)
+    if isinstance(value, ConfigNode):
+        data = value._data
+        size += sys.getsizeof(data)
+        for k, v in data.items():
+            size += sys.getsizeof(k) + estimate_size(v)
+    elif isinstance(value, dict):
+        for k, v in value.items():
+            size += sys.getsizeof(k) + estimate_size(v)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            size += estimate_size(v)
+    return size
+
+
+class _Entry:
+    __slots__ = ("manager", "signature", "checked", "size", "ready", "error", "lock")
+
+    def __init__(self):
+        self.manager = None
+        self.signature = None
+        self.checked = 0.0
+        self.size = 0
+        # set once the first load finished (successfully or not)
+        self.ready = threading.Event()
+        self.error = None
+        # held while revalidating/reloading
+        self.lock = threading.Lock()
+
+
+class ConfigPool:
+    """LRU pool of loaded ConfigManagers keyed by file, format and schema."""
+
+    def __init__(self, max_entries: int = 128, max_bytes: int | None = None,
+                 revalidate_interval: float = 1.0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.revalidate_interval = revalidate_interval
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._stats = dict.fromkeys(
+            ("hits", "misses", "coalesced", "reloads", "evictions"), 0
+        )
+
+    # ---------------------------------------------------------
+    # OPEN
+    # ---------------------------------------------------------
+    def open(self, factory, path, filetype=None, schema=None, lazy=False, **kwargs):
+        """
+        Pooled, loaded factory(path, ...) instance. kwargs are only used when
+        the manager is created (the pool key is path, filetype, schema, lazy).
+        """
+        compiled = compile_schema(schema) if schema is not None else None
+        # structural key: a schema literal rebuilt per call maps to the same entry
+        try:
+            fingerprint = schema_key(schema)
+            hash(fingerprint)
+        except TypeError:
+            fingerprint = compiled
+        key = (os.path.abspath(path), filetype, fingerprint, lazy)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry()
+                owner = True
+                self._stats["misses"] += 1
+            else:
+                self._entries.move_to_end(key)
+                owner = False
+                if entry.ready.is_set():
+                    self._stats["hits"] += 1
+                else:
+                    self._stats["coalesced"] += 1
+
+        if owner:
+            return self._first_load(key, entry, factory, path, filetype, compiled, lazy, kwargs)
+
+        entry.ready.wait()
+        if entry.error is not None:
+            raise entry.error
+        self._revalidate(key, entry)
+        return entry.manager
+
+    def _first_load(self, key, entry, factory, path, filetype, schema, lazy, kwargs):
+        try:
+            signature = _signature(path)
+            manager = factory(path, filetype=filetype, schema=schema, lazy=lazy, **kwargs)
+            manager.load()
+        except BaseException as e:
+            entry.error = e
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+            entry.ready.set()
+            raise
+        entry.manager = manager
+        entry.signature = signature
+        entry.checked = time.monotonic()
+        self._resize(entry)
+        entry.ready.set()
+        self._evict()
+        return manager
+
+    def _revalidate(self, key, entry):
+        now = time.monotonic()
+        if now - entry.checked < self.revalidate_interval:
+            return
+        # someone else is already checking/reloading → use the current tree
+        if not entry.lock.acquire(blocking=False):
+            return
+        try:
+            entry.checked = now
+            signature = _signature(entry.manager.path)
+            # unchanged, or gone (reload() would create an empty file) → keep the tree
+            if signature == entry.signature or signature is None:
+                return
+            entry.manager.reload()
+            entry.signature = signature
+            with self._lock:
+                self._stats["reloads"] += 1
+            self._resize(entry)
+        finally:
+            entry.lock.release()
+        self._evict()
+
+    # ---------------------------------------------------------
+    # EVICTION
+    # ---------------------------------------------------------
+    def _resize(self, entry):
+        size = estimate_size(entry.manager._config) if self.max_bytes is not None else 0
+        with self._lock:
+            self._bytes += size - entry.size
+            entry.size = size
+
+    def _evict(self):
+        with self._lock:
+            while self._entries and (
+                len(self._entries) > self.max_entries
+                or (self.max_bytes is not None and self._bytes > self.max_bytes
+                    and len(self._entries) > 1)
+            ):
+                key, entry = next(iter(self._entries.items()))
+                if not entry.ready.is_set():
+                    # still loading → keep it, try the next oldest later
+                    self._entries.move_to_end(key)
+                    if all(not e.ready.is_set() for e in self._entries.values()):
+                        break
+                    continue
+                del self._entries[key]
+                self._bytes -= entry.size
+                self._stats["evictions"] += 1
+
+    def discard(self, path):
+        """Drop every pooled manager of path."""
+        path = os.path.abspath(path)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == path]:
+                self._bytes -= self._entries.pop(key).size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        """hits, misses, coalesced (waited for a concurrent first load), reloads,
+        evictions, entries and estimated bytes."""
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries), "bytes": self._bytes}
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_pool() -> ConfigPool:
+    """The pool used by ConfigManager.open() when no pool is given."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = ConfigPool()
+        return _default
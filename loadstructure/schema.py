@@ -0,0 +1,320 @@
+import threading
+import types
+import typing
+from collections import OrderedDict
+
+
+class SchemaError(Exception):
+    """Raised when configuration does not match the schema rules."""
+
+    def __init__(self, message="", path=None):
+        super().__init__(message)
+        self.path = path
+
+
+def _type_name(value):
+    return type(value).__name__
+
+
+def _mapping_types():
+    from loadstructure.config_node import ConfigNode
+    return (dict, ConfigNode)
+
+
+def _mapping_items(value):
+    """Items of a dict or ConfigNode without materializing lazy children."""
+    if isinstance(value, dict):
+        return value.items()
+    return value._data.items()
+
+
+def _join(path, key):
+    return f"{path}.{key}" if path else str(key)
+
+
+# ---------------------------------------------------------
+# COMPILED RULES
+# ---------------------------------------------------------
+class Rule:
+    """
+    A precompiled schema rule.
+
+    validate(value) checks a single value (one call per value on hot paths),
+    collect(value, path, errors, strict) appends every violation found below value.
+    """
+    __slots__ = ()
+
+    # may be auto-created as an empty node
+    container = False
+    # compiled schema used to wrap dict values (None → free node)
+    subschema = None
+    # rule for list elements
+    item = None
+    name = "any"
+
+    def validate(self, value):
+        pass
+
+    def collect(self, value, path, errors, strict=True):
+        try:
+            self.validate(value)
+        except SchemaError as e:
+            errors.append(SchemaError(f"{path}: {e}", path))
+            return False
+        return True
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class AnyRule(Rule):
+    __slots__ = ()
+    container = True
+
+
+class NoneRule(Rule):
+    __slots__ = ()
+    name = "None"
+
+    def validate(self, value):
+        if value is not None:
+            raise SchemaError(f"value must be None, got {_type_name(value)}")
+
+
+class TypeRule(Rule):
+    __slots__ = ("type", "name")
+
+    def __init__(self, tp):
+        self.type = tp
+        self.name = tp.__name__
+
+    def validate(self, value):
+        if not isinstance(value, self.type):
+            raise SchemaError(
+                f"value must be {self.name}, got {_type_name(value)}"
+            )
+
+
+class DictRule(Rule):
+    """`dict` → any mapping, wrapped as a free node."""
+    __slots__ = ("types",)
+    container = True
+    name = "dict"
+
+    def __init__(self):
+        self.types = _mapping_types()
+
+    def validate(self, value):
+        if not isinstance(value, self.types):
+            raise SchemaError(f"value must be dict, got {_type_name(value)}")
+
+
+class ListRule(Rule):
+    """`list` or `[rule]` → a list, optionally with typed elements."""
+    __slots__ = ("item", "name")
+
+    def __init__(self, item=None):
+        self.item = item
+        self.name = "list" if item is None else f"list[{item.name}]"
+
+    def validate(self, value):
+        if not isinstance(value, list):
+            raise SchemaError(f"value must be list, got {_type_name(value)}")
+        item = self.item
+        if item is not None:
+            for i, v in enumerate(value):
+                try:
+                    item.validate(v)
+                except SchemaError as e:
+                    raise SchemaError(f"list item {i}: {e}") from None
+
+    def collect(self, value, path, errors, strict=True):
+        if not isinstance(value, list):
+            return super().collect(value, path, errors, strict)
+        ok = True
+        if self.item is not None:
+            for i, v in enumerate(value):
+                ok = self.item.collect(v, f"{path}[{i}]", errors, strict) and ok
+        return ok
+
+
+class UnionRule(Rule):
+    """`(int, str)`, `int | None` or `Optional[int]` → any of the members."""
+    __slots__ = ("members", "name", "container", "subschema", "item")
+
+    def __init__(self, members):
+        self.members = tuple(members)
+        self.name = " | ".join(m.name for m in self.members)
+        self.container = any(m.container for m in self.members)
+        self.subschema = next(
+            (m.subschema for m in self.members if m.container), None
+        )
+        self.item = next(
+            (m.item for m in self.members if isinstance(m, ListRule)), None
+        )
+
+    def validate(self, value):
+        for m in self.members:
+            try:
+                m.validate(value)
+                return
+            except SchemaError:
+                continue
+        raise SchemaError(f"value must be {self.name}, got {_type_name(value)}")
+
+    def collect(self, value, path, errors, strict=True):
+        for m in self.members:
+            found = []
+            if m.collect(value, path, found, strict):
+                return True
+        return super().collect(value, path, errors, strict)
+
+
+class SchemaRule(Rule):
+    """A nested dict schema: field name → compiled rule."""
+    __slots__ = ("fields", "types")
+    container = True
+    name = "dict"
+
+    def __init__(self):
+        self.fields = {}
+        self.types = _mapping_types()
+
+    @property
+    def subschema(self):
+        return self
+
+    def validate(self, value):
+        if not isinstance(value, self.types):
+            raise SchemaError("value must be object/dict for schema field")
+
+    def collect(self, value, path, errors, strict=True):
+        if not isinstance(value, self.types):
+            return super().collect(value, path, errors, strict)
+        ok = True
+        fields = self.fields
+        for key, v in _mapping_items(value):
+            sub = _join(path, key)
+            rule = fields.get(key)
+            if rule is None:
+                if not strict:
+                    continue
+                errors.append(
+                    SchemaError(f"{sub}: '{key}' is not allowed by the schema.", sub)
+                )
+                ok = False
+                continue
+            ok = rule.collect(v, sub, errors, strict) and ok
+        return ok
+
+    def validate_all(self, value, strict=True) -> list[SchemaError]:
+        """
+        Return every violation in value (a dict or ConfigNode) in one pass.
+        strict=False → keys unknown to the schema are tolerated (as load() does).
+        """
+        errors = []
+        self.collect(value, "", errors, strict)
+        return errors
+
+    # mapping interface used by ConfigNode
+    def __contains__(self, key): return key in self.fields
+    def __getitem__(self, key): return self.fields[key]
+    def get(self, key, default=None): return self.fields.get(key, default)
+    def keys(self): return self.fields.keys()
+
+
+# ---------------------------------------------------------
+# COMPILER
+# ---------------------------------------------------------
+# schema_key(schema) → compiled rule; least recently used evicted above _CACHE_SIZE
+_CACHE_SIZE = 256
+_compiled: OrderedDict = OrderedDict()
+_compiled_lock = threading.Lock()
+
+
+def schema_key(schema):
+    """Hashable structural form of a schema: equal schemas give equal keys."""
+    if isinstance(schema, dict):
+        return ("dict", tuple((k, schema_key(v)) for k, v in schema.items()))
+    if isinstance(schema, list):
+        return ("list", tuple(schema_key(v) for v in schema))
+    if isinstance(schema, tuple):
+        return ("union", tuple(schema_key(v) for v in schema))
+    # types, typing forms, None, compiled Rules (by identity)
+    return schema
+
+
+def compile_schema(schema) -> Rule:
+    """
+    Compile a schema into a tree of Rule objects. Structurally equal
+    schemas share one compiled rule from a bounded cache, so schema
+    literals built per call are compiled once.
+
+    Accepted rules:
+        str, int, ...           → isinstance check
+        dict                    → any mapping (free node)
+        {"key": rule, ...}      → nested schema
+        list / [rule] / list[x] → list, optionally with typed elements
+        (a, b) / a | b          → union (Optional[x] and x | None included)
+        None                    → value must be None
+        object / typing.Any     → anything
+    """
+    if isinstance(schema, Rule):
+        return schema
+    # only containers are worth caching
+    if not isinstance(schema, (dict, list, tuple)):
+        return _compile(schema)
+    key = schema_key(schema)
+    try:
+        hash(key)
+    except TypeError:
+        return _compile(schema)
+
+    with _compiled_lock:
+        rule = _compiled.get(key)
+        if rule is not None:
+            _compiled.move_to_end(key)
+            return rule
+
+    rule = _compile(schema)
+    with _compiled_lock:
+        # compiled concurrently → keep the first one
+        rule = _compiled.setdefault(key, rule)
+        _compiled.move_to_end(key)
+        while len(_compiled) > _CACHE_SIZE:
+            _compiled.popitem(last=False)
+    return rule
+
+
+def _compile_sub(schema) -> Rule:
+    return schema if isinstance(schema, Rule) else _compile(schema)
+
+
+def _compile(schema) -> Rule:
+    if schema is None or schema is type(None):
+        return NoneRule()
+    if schema is object or schema is typing.Any:
+        return AnyRule()
+    if schema is dict:
+        return DictRule()
+    if schema is list:
+        return ListRule()
+    if isinstance(schema, dict):
+        rule = SchemaRule()
+        for key, sub in schema.items():
+            rule.fields[key] = _compile_sub(sub)
+        return rule
+    if isinstance(schema, list):
+        if len(schema) != 1:
+            raise SchemaError("list schema must hold exactly one element rule")
+        return ListRule(_compile_sub(schema[0]))
+    if typing.get_origin(schema) is list:
+        args = typing.get_args(schema)
+        return ListRule(_compile_sub(args[0]) if args else None)
+    if isinstance(schema, tuple):
+        return UnionRule(_compile_sub(s) for s in schema)
+    if isinstance(schema, types.UnionType) or typing.get_origin(schema) is typing.Union:
+        return UnionRule(_compile_sub(s) for s in typing.get_args(schema))
+    if isinstance(schema, type):
+        return TypeRule(schema)
+    raise SchemaError(f"Unsupported schema rule: {schema!r}")
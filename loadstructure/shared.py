@@ -0,0 +1,232 @@
+"""
+Config snapshots shared between processes through shared memory.
+
+One process (typically a pre-fork master) loads and watches the config and
+publishes every version into multiprocessing.shared_memory; workers attach
+by name and never parse or watch the file themselves:
+
+    # master
+    config = ConfigManager("app.yaml")
+    config.load()
+    publisher = config.share("app-config")       # publishes now + on every reload
+
+    # each worker
+    shared = ConfigManager.attach("app-config")
+    cfg = shared.snapshot()                      # FrozenNode, decoded on first use
+
+Layout: a small control segment (name given by the user) holds a sequence
+counter, the current version and the name/length of a data segment. Each
+version gets its own immutable data segment holding the pickled FrozenNode;
+the previous one is unlinked once the next is published (attached readers
+keep their mapping). The control block is updated under a seqlock: writers
+make the counter odd while writing and even when done, readers retry until
+they read the same even value before and after.
+
+Segments are created with mode 0600 (only the publishing user can attach).
+Payloads are pickles: only attach to segments your own processes publish.
+"""
+import os
+import pickle
+import struct
+import threading
+import time
+from multiprocessing import shared_memory
+
+from loadstructure.frozen import FrozenNode, freeze
+
+_MAGIC = b"LSSHM003"
+# magic, sequence, version, data length, owner pid, data segment name (NUL padded)
+_CONTROL = struct.Struct("<8sQQQQ255s")
+_SEQ_OFFSET = 8
+# "-" + the largest version number must still fit the name field
+_MAX_NAME = 255 - 21
+
+
+def _data_name(name: str, version: int) -> str:
+    return f"{name}-{version}"
+
+
+def _alive(pid: int) -> bool:
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # exists, owned by another user
+        return True
+    return True
+
+
+class SharedPublisher:
+    """
+    Writes snapshots of a ConfigManager into shared memory.
+    A name still published by a live process raises FileExistsError
+    unless replace=True; segments of a dead publisher are taken over.
+    """
+
+    def __init__(self, manager, name: str, watch: bool = True, replace: bool = False,
+                 **watch_kwargs):
+        if len(name.encode()) > _MAX_NAME:
+            raise ValueError(f"Shared memory name longer than {_MAX_NAME} bytes: {name!r}")
+        self.manager = manager
+        self.name = name
+        self.version = 0
+        self._data = None
+        # FrozenNode behind the current version (unchanged reloads are not republished)
+        self._published = None
+        self._lock = threading.Lock()
+        try:
+            self._control = shared_memory.SharedMemory(name, create=True, size=_CONTROL.size)
+        except FileExistsError:
+            control = shared_memory.SharedMemory(name)
+            if control.size < _CONTROL.size:
+                control.close()
+                raise ValueError(f"{name!r} is not a loadstructure segment") from None
+            magic, seq, version, _, pid, data_name = _CONTROL.unpack_from(control.buf)
+            if magic == _MAGIC and _alive(pid) and not replace:
+                control.close()
+                raise FileExistsError(
+                    f"{name!r} is published by running process {pid} (pass replace=True to take over)"
+                ) from None
+            # left behind by a publisher that died (or replace=True) → take it over
+            self._control = control
+            if magic == _MAGIC:
+                self.version = version
+                try:
+                    stale = shared_memory.SharedMemory(data_name.rstrip(b"\0").decode())
+                    stale.close()
+                    stale.unlink()
+                except (FileNotFoundError, ValueError):
+                    pass
+        self.publish()
+        self._handle = None
+        if watch:
+            self._handle = manager.watch(on_reload=lambda m: self.publish(), **watch_kwargs)
+
+    def publish(self) -> int:
+        """Publish the manager's current snapshot; returns its version."""
+        with self._lock:
+            snapshot = self.manager.snapshot()
+            if snapshot is self._published:
+                return self.version
+            payload = pickle.dumps(snapshot, pickle.HIGHEST_PROTOCOL)
+            version = self.version + 1
+            data_name = _data_name(self.name, version)
+            data = shared_memory.SharedMemory(data_name, create=True, size=max(len(payload), 1))
+            data.buf[:len(payload)] = payload
+
+            buf = self._control.buf
+            seq = _CONTROL.unpack_from(buf)[1]
+            # odd → readers retry
+            struct.pack_into("<Q", buf, _SEQ_OFFSET, seq + 1)
+            _CONTROL.pack_into(
+                buf, 0, _MAGIC, seq + 1, version, len(payload), os.getpid(), data_name.encode()
+            )
+            struct.pack_into("<Q", buf, _SEQ_OFFSET, seq + 2)
+
+            previous, self._data, self.version = self._data, data, version
+            self._published = snapshot
+            if previous is not None:
+                previous.close()
+                previous.unlink()
+            return version
+
+    def close(self):
+        """Stop watching and remove the shared segments."""
+        if self._handle is not None:
+            self._handle.stop()
+            self._handle = None
+        with self._lock:
+            for segment in (self._data, self._control):
+                if segment is not None:
+                    segment.close()
+                    try:
+                        segment.unlink()
+                    except FileNotFoundError:
+                        pass
+            self._data = self._control = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class SharedSubscriber:
+    """
+    Reads snapshots published by SharedPublisher. snapshot() costs one
+    control-block read while the version is unchanged; a new version is
+    decoded the first time it is asked for.
+    check_interval = minimum seconds between control-block reads.
+    """
+
+    def __init__(self, name: str, check_interval: float = 0.0):
+        self.name = name
+        self.check_interval = check_interval
+        # the publisher owns the segments → don't let this process's tracker unlink them
+        self._control = shared_memory.SharedMemory(name, track=False)
+        self._current = (0, None)   # (version, FrozenNode)
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    def _read_control(self):
+        buf = self._control.buf
+        for _ in range(10000):
+            magic, seq, version, length, _, data_name = _CONTROL.unpack_from(buf)
+            if seq % 2 == 0 and _CONTROL.unpack_from(buf)[1] == seq:
+                if magic != _MAGIC:
+                    raise ValueError(f"{self.name!r} is not a loadstructure segment")
+                return version, length, data_name.rstrip(b"\0").decode()
+            time.sleep(0)
+        raise TimeoutError(f"Control block of {self.name!r} kept changing")
+
+    @property
+    def version(self) -> int:
+        """Latest published version (reads the control block)."""
+        return self._read_control()[0]
+
+    def snapshot(self) -> FrozenNode:
+        current = self._current
+        if self.check_interval:
+            now = time.monotonic()
+            if current[1] is not None and now < self._next_check:
+                return current[1]
+            self._next_check = now + self.check_interval
+        version = self._read_control()[0]
+        if version == current[0]:
+            return current[1]
+        with self._lock:
+            for _ in range(1000):
+                version, length, data_name = self._read_control()
+                if version == self._current[0]:
+                    return self._current[1]
+                try:
+                    data = shared_memory.SharedMemory(data_name, track=False)
+                except FileNotFoundError:
+                    # replaced between reading the control block and attaching
+                    time.sleep(0)
+                    continue
+                try:
+                    with data.buf[:length] as view:
+                        snapshot = freeze(pickle.loads(view))
+                finally:
+                    data.close()
+                self._current = (version, snapshot)
+                return snapshot
+            raise TimeoutError(
+                f"Data segment of {self.name!r} is missing (publisher gone?)"
+            )
+
+    def close(self):
+        if self._control is not None:
+            self._control.close()
+            self._control = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
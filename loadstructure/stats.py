@@ -0,0 +1,157 @@
+"""
+Instrumentation: per-phase timings and counters.
+
+Off by default. ConfigManager(..., instrument=True) (or hook=callable)
+keeps a Stats object with timings of its load/reload/merge/save phases:
+
+    load, reload,
+    merge, save → the whole call
+    read        → reading the file (or mapping it)
+    parse       → the format parser (or a parse cache hit)
+    wrap        → building the ConfigNode tree, schema checks excluded
+    validate    → schema checks
+    sync        → applying a reload to the existing tree
+    merge_dicts → merging the parsed files of merge()
+    to_dict     → unwrapping before save (codecs without a node emitter)
+    write       → serializing + atomic write
+
+Tree-level counters (nodes created, keys auto-created by attribute access,
+validations) are process-wide, since nodes do not know their manager;
+they are collected once any instrumented manager exists or enable() was
+called. While they are off, ConfigNode pays one module attribute check
+per node.
+
+hook(kind, name, value) receives every event: kind is "timing" (value in
+seconds) or "count" (value is the increment).
+"""
+import threading
+import time
+
+perf_counter = time.perf_counter
+
+
+class NodeCounters:
+    """Process-wide ConfigNode counters (plain attributes: cheap to bump)."""
+    __slots__ = ("nodes_created", "auto_created", "validations", "validate_seconds")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.nodes_created = 0
+        self.auto_created = 0
+        self.validations = 0
+        self.validate_seconds = 0.0
+
+    def validate(self, rule, value):
+        """rule.validate(value), counted and timed."""
+        start = perf_counter()
+        try:
+            rule.validate(value)
+        finally:
+            self.validations += 1
+            self.validate_seconds += perf_counter() - start
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+# set by enable(); read by ConfigNode on every node creation / validation
+node_counters: NodeCounters | None = None
+_enable_lock = threading.Lock()
+
+
+def enable() -> NodeCounters:
+    """Start collecting the process-wide node counters (idempotent)."""
+    global node_counters
+    with _enable_lock:
+        if node_counters is None:
+            node_counters = NodeCounters()
+        return node_counters
+
+
+def disable():
+    global node_counters
+    node_counters = None
+
+
+def counters() -> dict:
+    """Process-wide node counters ({} while disabled)."""
+    current = node_counters
+    return current.as_dict() if current is not None else {}
+
+
+class _Timer:
+    __slots__ = ("stats", "name", "start")
+
+    def __init__(self, stats, name):
+        self.stats = stats
+        self.name = name
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.stats.add_time(self.name, perf_counter() - self.start)
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+NULL_TIMER = _NullTimer()
+
+
+class Stats:
+    """Phase timings and counters of one ConfigManager."""
+
+    def __init__(self, hook=None):
+        self.hook = hook
+        # name → [calls, total seconds, max seconds, last seconds]
+        self.phases = {}
+        self.counts = {}
+        self._lock = threading.Lock()
+
+    def timer(self, name: str) -> _Timer:
+        return _Timer(self, name)
+
+    def add_time(self, name: str, seconds: float):
+        with self._lock:
+            entry = self.phases.get(name)
+            if entry is None:
+                entry = self.phases[name] = [0, 0.0, 0.0, 0.0]
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = max(entry[2], seconds)
+            entry[3] = seconds
+        if self.hook is not None:
+            self.hook("timing", name, seconds)
+
+    def count(self, name: str, n: int = 1):
+        if not n:
+            return
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + n
+        if self.hook is not None:
+            self.hook("count", name, n)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            phases = {
+                name: {"calls": calls, "total": total, "max": peak, "last": last}
+                for name, (calls, total, peak, last) in self.phases.items()
+            }
+            counts = dict(self.counts)
+        return {"phases": phases, "counters": counts, "process": counters()}
+
+    def reset(self):
+        with self._lock:
+            self.phases.clear()
+            self.counts.clear()
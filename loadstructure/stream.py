@@ -0,0 +1,399 @@
+"""
+Selective loading: parse only the subtrees named by dotted paths.
+
+JSON, YAML and XML are scanned event by event and branches outside the
+selection are skipped without building them, so memory follows the size
+of the selected subtrees rather than the size of the file:
+    * JSON → byte-level scanner (regex, works on bytes and mmap); selected
+      values are decoded with json.loads on their slice.
+    * YAML → yaml.parse() events (C parser when available); selected
+      subtrees are composed and constructed with the safe constructor.
+    * XML  → expat callbacks, selected elements converted like xmltodict.
+Other formats are parsed completely and then trimmed.
+
+The result keeps the selected values at their original paths:
+only=["modules.export"] → {"modules": {"export": {...}}}. Paths name
+mapping keys; missing paths are simply absent. Results match a full
+parse followed by extract(): duplicate keys keep the last value (so the
+whole document is scanned), and YAML keys are compared after tag
+resolution (the key 1 is an int, not "1").
+"""
+import json
+import re
+from xml.parsers import expat
+
+import yaml
+
+# trie value marking "take this whole value"
+_ALL = True
+
+
+def build_selection(only) -> dict:
+    """Turn dotted paths into a nested dict; a shorter path wins over a longer one."""
+    if isinstance(only, str):
+        only = [only]
+    trie = {}
+    for dotted_key in only:
+        parts = dotted_key.split(".")
+        t = trie
+        for p in parts[:-1]:
+            nxt = t.get(p)
+            if nxt is _ALL:
+                break
+            t = t.setdefault(p, {})
+        else:
+            t[parts[-1]] = _ALL
+    return trie
+
+
+def extract(data, selection):
+    """Trim already parsed data down to selection (fallback for every format)."""
+    out = {}
+    if not isinstance(data, dict):
+        return out
+    for key, sub in selection.items():
+        if key not in data:
+            continue
+        if sub is _ALL:
+            out[key] = data[key]
+        else:
+            value = extract(data[key], sub)
+            if value:
+                out[key] = value
+    return out
+
+
+# ---------------------------------------------------------
+# JSON
+# ---------------------------------------------------------
+_WS = re.compile(rb"[ \t\n\r]*")
+_STRING = re.compile(rb'"(?:[^"\\]|\\.)*"', re.DOTALL)
+# everything up to the next bracket, strings (which may hold brackets) included
+_NO_BRACKET = re.compile(rb'(?:[^"\[\]{}]+|"(?:[^"\\]|\\.)*")*', re.DOTALL)
+_SCALAR = re.compile(rb"[^,}\]\s]+")
+
+
+def _json_error(msg, pos):
+    return ValueError(f"Invalid JSON: {msg} at byte {pos}")
+
+
+def _json_skip(buf, pos) -> int:
+    """End offset of the JSON value starting at pos; nothing is decoded."""
+    first = buf[pos:pos + 1]
+    if first == b'"':
+        m = _STRING.match(buf, pos)
+        if m is None:
+            raise _json_error("unterminated string", pos)
+        return m.end()
+    if first in (b"{", b"["):
+        start, depth, end = pos, 0, len(buf)
+        while pos < end:
+            # one regex call per bracket, not per token
+            pos = _NO_BRACKET.match(buf, pos).end()
+            tok = buf[pos:pos + 1]
+            if tok in (b"{", b"["):
+                depth += 1
+            elif tok in (b"}", b"]"):
+                depth -= 1
+                if depth == 0:
+                    return pos + 1
+            else:
+                break
+            pos += 1
+        raise _json_error("unterminated container", start)
+    m = _SCALAR.match(buf, pos)
+    if m is None:
+        raise _json_error("expected a value", pos)
+    return m.end()
+
+
+def _json_key(buf, pos):
+    m = _STRING.match(buf, pos)
+    if m is None:
+        raise _json_error("expected a key", pos)
+    raw = m.group()
+    key = json.loads(raw) if b"\\" in raw else str(raw[1:-1], "utf-8")
+    return key, m.end()
+
+
+def _json_select(buf, pos, selection):
+    """
+    Walk the object at pos, decoding only selected members.
+    A repeated key replaces the earlier value, like json.loads.
+    Returns (dict or None, end offset).
+    """
+    if buf[pos:pos + 1] != b"{":
+        return None, _json_skip(buf, pos)
+    out = {}
+    pos = _WS.match(buf, pos + 1).end()
+    if buf[pos:pos + 1] == b"}":
+        return out, pos + 1
+    while True:
+        key, pos = _json_key(buf, pos)
+        pos = _WS.match(buf, pos).end()
+        if buf[pos:pos + 1] != b":":
+            raise _json_error("expected ':'", pos)
+        pos = _WS.match(buf, pos + 1).end()
+        sub = selection.get(key)
+        if sub is _ALL:
+            end = _json_skip(buf, pos)
+            out[key] = json.loads(buf[pos:end])
+            pos = end
+        elif sub is not None:
+            value, pos = _json_select(buf, pos, sub)
+            if value:
+                out[key] = value
+            else:
+                out.pop(key, None)
+        else:
+            pos = _json_skip(buf, pos)
+        pos = _WS.match(buf, pos).end()
+        sep = buf[pos:pos + 1]
+        if sep == b"}":
+            return out, pos + 1
+        if sep != b",":
+            raise _json_error("expected ',' or '}'", pos)
+        pos = _WS.match(buf, pos + 1).end()
+
+
+def select_json(buf, selection) -> dict:
+    pos = _WS.match(buf, 0).end()
+    if buf[pos:pos + 3] == b"\xef\xbb\xbf":
+        pos = _WS.match(buf, pos + 3).end()
+    value, _ = _json_select(buf, pos, selection)
+    return value or {}
+
+
+# ---------------------------------------------------------
+# YAML
+# ---------------------------------------------------------
+class _Fallback(Exception):
+    """The selection needs information from skipped parts (aliases, merge keys)."""
+
+
+def _yaml_skip(events, event):
+    if isinstance(event, (yaml.ScalarEvent, yaml.AliasEvent)):
+        return
+    depth = 1
+    for event in events:
+        if isinstance(event, yaml.CollectionStartEvent):
+            depth += 1
+        elif isinstance(event, yaml.CollectionEndEvent):
+            depth -= 1
+            if depth == 0:
+                return
+
+
+def _yaml_compose(events, event, loader, anchors):
+    """Build a yaml node for the value starting with event (like Composer)."""
+    if isinstance(event, yaml.AliasEvent):
+        if event.anchor not in anchors:
+            raise _Fallback
+        return anchors[event.anchor]
+    if isinstance(event, yaml.ScalarEvent):
+        tag = event.tag
+        if tag is None or tag == "!":
+            tag = loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+        node = yaml.ScalarNode(tag, event.value, event.start_mark, event.end_mark,
+                               style=event.style)
+    elif isinstance(event, yaml.SequenceStartEvent):
+        tag = event.tag
+        if tag is None or tag == "!":
+            tag = loader.resolve(yaml.SequenceNode, None, event.implicit)
+        node = yaml.SequenceNode(tag, [], event.start_mark, None,
+                                 flow_style=event.flow_style)
+        if event.anchor is not None:
+            anchors[event.anchor] = node
+        for item in events:
+            if isinstance(item, yaml.SequenceEndEvent):
+                break
+            node.value.append(_yaml_compose(events, item, loader, anchors))
+        return node
+    elif isinstance(event, yaml.MappingStartEvent):
+        tag = event.tag
+        if tag is None or tag == "!":
+            tag = loader.resolve(yaml.MappingNode, None, event.implicit)
+        node = yaml.MappingNode(tag, [], event.start_mark, None,
+                                flow_style=event.flow_style)
+        if event.anchor is not None:
+            anchors[event.anchor] = node
+        for item in events:
+            if isinstance(item, yaml.MappingEndEvent):
+                break
+            key = _yaml_compose(events, item, loader, anchors)
+            value = _yaml_compose(events, next(events), loader, anchors)
+            node.value.append((key, value))
+        return node
+    else:
+        raise _Fallback
+    if event.anchor is not None:
+        anchors[event.anchor] = node
+    return node
+
+
+def _yaml_key(item, loader):
+    """Key of a scalar key event as the loader constructs it (1 → int, "1" → str)."""
+    tag = item.tag
+    if tag is None or tag == "!":
+        tag = loader.resolve(yaml.ScalarNode, item.value, item.implicit)
+    if tag == "tag:yaml.org,2002:str":
+        return item.value
+    if tag == "tag:yaml.org,2002:merge":
+        # merge key: selected values may come from the merged mapping
+        raise _Fallback
+    return loader.construct_document(yaml.ScalarNode(tag, item.value, item.start_mark, item.end_mark))
+
+
+def _yaml_select(events, event, selection, loader, anchors):
+    """Like _json_select (last duplicate wins); returns dict or None."""
+    if not isinstance(event, yaml.MappingStartEvent):
+        if isinstance(event, yaml.AliasEvent):
+            raise _Fallback
+        _yaml_skip(events, event)
+        return None
+    out = {}
+    for item in events:
+        if isinstance(item, yaml.MappingEndEvent):
+            return out
+        if not isinstance(item, yaml.ScalarEvent):
+            # complex key → never selected
+            _yaml_skip(events, item)
+            _yaml_skip(events, next(events))
+            continue
+        key = _yaml_key(item, loader)
+        value_event = next(events)
+        sub = selection.get(key) if isinstance(key, str) else None
+        if sub is _ALL:
+            node = _yaml_compose(events, value_event, loader, anchors)
+            out[key] = loader.construct_document(node)
+        elif sub is not None:
+            value = _yaml_select(events, value_event, sub, loader, anchors)
+            if value:
+                out[key] = value
+            else:
+                out.pop(key, None)
+        else:
+            _yaml_skip(events, value_event)
+    return out
+
+
+def select_yaml(buf, selection) -> dict:
+    loader_cls = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    # resolver + safe constructor for the selected nodes
+    loader = yaml.SafeLoader("")
+    events = yaml.parse(buf, Loader=loader_cls)
+    try:
+        for event in events:
+            if isinstance(event, yaml.NodeEvent):
+                return _yaml_select(events, event, selection, loader, {}) or {}
+        return {}
+    except _Fallback:
+        if hasattr(buf, "seek"):
+            buf.seek(0)
+        return extract(yaml.load(buf, Loader=loader_cls), selection)
+    finally:
+        events.close()
+
+
+# ---------------------------------------------------------
+# XML
+# ---------------------------------------------------------
+class _XmlSelector:
+    """
+    expat handler building only the selected elements, in the shape
+    xmltodict produces ("@attr", "#text", repeated tags → list).
+    Paths start below the root element, like the flattened full load.
+    """
+
+    def __init__(self, selection):
+        self.selection = selection
+        self.result = {}
+        # per open element: (selection below it or None, result dict or None)
+        self.stack = []
+        # xmltodict-style build state inside a selected element
+        self.capture = 0
+        self.items = []
+
+    def start(self, name, attrs):
+        if self.capture:
+            self.capture += 1
+            self._open(attrs)
+            return
+        if not self.stack:
+            self.stack.append((self.selection, self.result))
+            self._attrs(self.selection, self.result, attrs)
+            return
+        selection, target = self.stack[-1]
+        sub = selection.get(name) if selection else None
+        if sub is _ALL:
+            self.capture = 1
+            self._open(attrs)
+        elif sub:
+            child = {}
+            self._attrs(sub, child, attrs)
+            self.stack.append((sub, child))
+            return
+        self.stack.append((None, None))
+
+    def end(self, name):
+        if self.capture:
+            item, data = self.items.pop()
+            text = "".join(data).strip() or None
+            if item is None:
+                value = text
+            else:
+                if text is not None:
+                    item["#text"] = text
+                value = item
+            self.capture -= 1
+            if self.capture:
+                parent = self.items[-1]
+                if parent[0] is None:
+                    self.items[-1] = parent = ({}, parent[1])
+                _push(parent[0], name, value)
+                return
+            self.stack.pop()
+            _push(self.stack[-1][1], name, value)
+            return
+        selection, target = self.stack.pop()
+        if target and self.stack:
+            _push(self.stack[-1][1], name, target)
+
+    def data(self, text):
+        if self.capture:
+            self.items[-1][1].append(text)
+
+    def _open(self, attrs):
+        item = {"@" + k: v for k, v in attrs.items()} or None
+        self.items.append((item, []))
+
+    @staticmethod
+    def _attrs(selection, target, attrs):
+        for key, value in attrs.items():
+            if selection.get("@" + key) is _ALL:
+                target["@" + key] = value
+
+
+def _push(parent, name, value):
+    if name in parent:
+        current = parent[name]
+        if isinstance(current, list):
+            current.append(value)
+        else:
+            parent[name] = [current, value]
+    else:
+        parent[name] = value
+
+
+def select_xml(buf, selection) -> dict:
+    handler = _XmlSelector(selection)
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+    parser.StartElementHandler = handler.start
+    parser.EndElementHandler = handler.end
+    parser.CharacterDataHandler = handler.data
+    if isinstance(buf, bytes):
+        parser.Parse(buf, True)
+    else:
+        parser.ParseFile(buf)
+    return handler.result
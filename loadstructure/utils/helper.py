@@ -1,3 +1,7 @@
+import glob
+import os
+
+
 def _merge_dicts(a: dict, b: dict) -> dict:
     """
     Recursively merge dict b into dict a.
@@ -14,3 +18,46 @@ def _merge_dicts(a: dict, b: dict) -> dict:
         else:
             result[k] = v
     return result
+
+
+def _merge_into(a: dict, b: dict, owned: set) -> dict:
+    """
+    Recursively merge dict b into dict a in place and return a.
+    Subtrees of b are moved into a without copying, so b must not be
+    used afterwards (freshly parsed data). `owned` holds the ids of the
+    dicts the merge created (a included); any other dict may be shared,
+    e.g. by YAML aliases, so it is copied before it is modified.
+    """
+    for k, v in b.items():
+        current = a.get(k)
+        if isinstance(current, dict) and isinstance(v, dict):
+            if id(current) not in owned:
+                current = a[k] = dict(current)
+                owned.add(id(current))
+            _merge_into(current, v, owned)
+        else:
+            a[k] = v
+    return a
+
+
+def _expand_paths(patterns, extensions) -> list[str]:
+    """
+    Expand files, directories (conf.d style) and glob patterns into an
+    ordered list of files. Directories contribute their files with one of
+    `extensions`, sorted by name; globs are sorted too.
+    """
+    files = []
+    for pattern in patterns:
+        pattern = os.fspath(pattern)
+        if os.path.isdir(pattern):
+            files.extend(
+                os.path.join(pattern, name)
+                for name in sorted(os.listdir(pattern))
+                if os.path.splitext(name)[1].lower() in extensions
+                and os.path.isfile(os.path.join(pattern, name))
+            )
+        elif any(c in pattern for c in "*?["):
+            files.extend(sorted(glob.glob(pattern)))
+        else:
+            files.append(pattern)
+    return files
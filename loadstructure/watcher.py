@@ -0,0 +1,329 @@
+"""
+File watching shared by every ConfigManager in the process.
+
+One background thread serves all watched files:
+    * inotify (Linux) → no polling, directory watches so atomic
+      rename-over saves are seen, events debounced per file.
+    * polling fallback → a single thread stats every watched file at its
+      own interval and only fires once the file stopped changing.
+"""
+import ctypes
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+
+logger = logging.getLogger("loadstructure.watcher")
+
+# ---------------------------------------------------------
+# inotify constants (linux/inotify.h)
+# ---------------------------------------------------------
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+# only events that mean "a complete file is in place" → no half-written reads
+# (no IN_CREATE: a new file is empty until its writer closes it)
+_WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_ATTRIB
+_EVENT = struct.Struct("iIII")
+
+
+def _load_libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+    except OSError:
+        return None
+    if not hasattr(libc, "inotify_init1"):
+        return None
+    return libc
+
+
+class WatchHandle:
+    """Returned by watch(); call stop() to stop watching the file."""
+
+    def __init__(self, watcher, path, callback, interval, debounce):
+        self._watcher = watcher
+        self.path = path
+        self.callback = callback
+        self.interval = interval
+        self.debounce = debounce
+        self.active = True
+        # watcher-private state
+        self._deadline = None
+        self._next_check = 0.0
+        self._signature = None
+
+    def stop(self):
+        if self.active:
+            self.active = False
+            self._watcher.remove(self)
+
+    def _fire(self):
+        try:
+            self.callback()
+        except Exception:
+            logger.exception("reload of %s failed", self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def __repr__(self):
+        state = "active" if self.active else "stopped"
+        return f"<WatchHandle {self.path!r} {state}>"
+
+
+# ---------------------------------------------------------
+# INOTIFY WATCHER
+# ---------------------------------------------------------
+class InotifyWatcher:
+    """Watches parent directories with inotify; one thread for all files."""
+
+    def __init__(self, libc):
+        self._libc = libc
+        self._lock = threading.Lock()
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._fd = fd
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        self._dirs = {}       # directory → wd
+        self._handles = {}    # wd → {filename: [WatchHandle]}
+        self._thread = None
+
+    def add(self, path, callback, interval=1, debounce=0.1):
+        path = os.path.abspath(path)
+        directory, name = os.path.split(path)
+        handle = WatchHandle(self, path, callback, interval, debounce)
+        with self._lock:
+            wd = self._dirs.get(directory)
+            if wd is None:
+                wd = self._libc.inotify_add_watch(
+                    self._fd, os.fsencode(directory), _WATCH_MASK
+                )
+                if wd < 0:
+                    err = ctypes.get_errno()
+                    raise OSError(err, os.strerror(err), directory)
+                self._dirs[directory] = wd
+                self._handles[wd] = {}
+            self._handles[wd].setdefault(name, []).append(handle)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="loadstructure-watcher", daemon=True
+                )
+                self._thread.start()
+        return handle
+
+    def remove(self, handle):
+        directory, name = os.path.split(handle.path)
+        with self._lock:
+            wd = self._dirs.get(directory)
+            if wd is None:
+                return
+            names = self._handles[wd]
+            handles = names.get(name, [])
+            if handle in handles:
+                handles.remove(handle)
+            if not handles:
+                names.pop(name, None)
+            if not names:
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._dirs[directory]
+                del self._handles[wd]
+        self._wake()
+
+    def _wake(self):
+        try:
+            os.write(self._wake_w, b"\0")
+        except BlockingIOError:
+            pass
+
+    def _next_timeout(self, now):
+        deadlines = [
+            h._deadline
+            for names in self._handles.values()
+            for handles in names.values()
+            for h in handles
+            if h._deadline is not None
+        ]
+        if not deadlines:
+            return None
+        return max(0, int((min(deadlines) - now) * 1000) + 1)
+
+    def _run(self):
+        poller = select.poll()
+        poller.register(self._fd, select.POLLIN)
+        poller.register(self._wake_r, select.POLLIN)
+        while True:
+            with self._lock:
+                timeout = self._next_timeout(time.monotonic())
+            for fd, _ in poller.poll(timeout):
+                if fd == self._wake_r:
+                    try:
+                        os.read(self._wake_r, 4096)
+                    except BlockingIOError:
+                        pass
+                else:
+                    self._read_events()
+            self._fire_due()
+
+    def _read_events(self):
+        try:
+            buf = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        now = time.monotonic()
+        with self._lock:
+            offset = 0
+            while offset < len(buf):
+                wd, mask, _cookie, length = _EVENT.unpack_from(buf, offset)
+                offset += _EVENT.size
+                name = buf[offset:offset + length].rstrip(b"\0")
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    # events were dropped → treat every file as changed
+                    targets = [
+                        h for names in self._handles.values()
+                        for hs in names.values() for h in hs
+                    ]
+                else:
+                    names = self._handles.get(wd, {})
+                    targets = names.get(os.fsdecode(name), [])
+                for h in targets:
+                    # every new event pushes the deadline → bursts debounce
+                    h._deadline = now + h.debounce
+
+    def _fire_due(self):
+        now = time.monotonic()
+        with self._lock:
+            due = [
+                h
+                for names in self._handles.values()
+                for handles in names.values()
+                for h in handles
+                if h._deadline is not None and h._deadline <= now
+            ]
+            for h in due:
+                h._deadline = None
+        for h in due:
+            if h.active:
+                h._fire()
+
+
+# ---------------------------------------------------------
+# POLLING WATCHER (fallback)
+# ---------------------------------------------------------
+def _signature(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class PollingWatcher:
+    """Stats every watched file at its interval from a single thread."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._handles = []
+        self._thread = None
+
+    def add(self, path, callback, interval=1, debounce=0.1):
+        handle = WatchHandle(self, os.path.abspath(path), callback, interval, debounce)
+        handle._signature = _signature(handle.path)
+        handle._next_check = time.monotonic() + interval
+        with self._cond:
+            self._handles.append(handle)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="loadstructure-poller", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+        return handle
+
+    def remove(self, handle):
+        with self._cond:
+            if handle in self._handles:
+                self._handles.remove(handle)
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._handles:
+                    self._cond.wait()
+                now = time.monotonic()
+                wake = min(
+                    h._deadline if h._deadline is not None else h._next_check
+                    for h in self._handles
+                )
+                if wake > now:
+                    self._cond.wait(wake - now)
+                    continue
+                handles = list(self._handles)
+            self._check(handles, now)
+
+    def _check(self, handles, now):
+        for h in handles:
+            due = h._deadline if h._deadline is not None else h._next_check
+            if due > now:
+                continue
+            h._next_check = now + h.interval
+            sig = _signature(h.path)
+            if sig is None:
+                h._deadline = None
+                continue
+            if sig != h._signature:
+                # changed → wait until it stays unchanged for `debounce`
+                h._signature = sig
+                h._deadline = now + max(h.debounce, 0.01)
+            elif h._deadline is not None:
+                h._deadline = None
+                if h.active:
+                    h._fire()
+
+
+# ---------------------------------------------------------
+# SHARED INSTANCES
+# ---------------------------------------------------------
+_lock = threading.Lock()
+_watchers = {}
+
+
+def get_watcher(backend: str = "auto"):
+    """Return the process-wide watcher for backend ("auto", "inotify" or "poll")."""
+    with _lock:
+        if backend == "auto":
+            backend = "inotify" if _load_libc() is not None else "poll"
+        watcher = _watchers.get(backend)
+        if watcher is None:
+            if backend == "inotify":
+                libc = _load_libc()
+                if libc is None:
+                    raise OSError("inotify is not available on this platform")
+                watcher = InotifyWatcher(libc)
+            elif backend == "poll":
+                watcher = PollingWatcher()
+            else:
+                raise ValueError(f"Unknown watch backend: {backend}")
+            _watchers[backend] = watcher
+        return watcher
+
+
+def watch_file(path, callback, interval=1, debounce=0.1, backend="auto") -> WatchHandle:
+    """Call callback() after path changes; returns a handle with stop()."""
+    return get_watcher(backend).add(path, callback, interval, debounce)
@@ -0,0 +1,62 @@
+import pytest
+
+from loadstructure import SchemaError
+from loadstructure.config_node import ConfigNode
+
+SCHEMA = {"a": int, "db": {"port": int}, "items": [{"x": int}]}
+
+
+def make():
+    return ConfigNode({"a": 1, "db": {"port": 5432}, "items": [{"x": 1}]}, SCHEMA)
+
+
+def test_set_many_rejects_nested_violation_before_applying():
+    cfg = make()
+    with pytest.raises(SchemaError):
+        cfg.set_many({"a": 2, "db": {"port": "x"}})
+    assert cfg.to_dict() == {"a": 1, "db": {"port": 5432}, "items": [{"x": 1}]}
+
+
+def test_set_many_rejects_list_item_violation_before_applying():
+    cfg = make()
+    with pytest.raises(SchemaError):
+        cfg.set_many({"a": 2, "items": [{"x": "bad"}]})
+    assert cfg.a == 1
+    assert cfg.to_dict()["items"] == [{"x": 1}]
+
+
+def test_apply_patch_rejects_nested_violation_before_applying():
+    cfg = make()
+    with pytest.raises(SchemaError):
+        cfg.apply_patch([
+            {"op": "replace", "path": "/a", "value": 3},
+            {"op": "replace", "path": "/db", "value": {"port": "bad"}},
+        ])
+    assert cfg.to_dict() == {"a": 1, "db": {"port": 5432}, "items": [{"x": 1}]}
+
+
+def test_apply_patch_checks_each_op_against_the_patched_tree():
+    cfg = ConfigNode({"l": [1, 2, 3]})
+    with pytest.raises(ValueError):
+        cfg.apply_patch([
+            {"op": "remove", "path": "/l/2"},
+            {"op": "remove", "path": "/l/2"},
+        ])
+    assert cfg.to_dict() == {"l": [1, 2, 3]}
+
+
+def test_apply_patch_test_op_sees_earlier_ops():
+    cfg = ConfigNode({"a": 1})
+    cfg.apply_patch([
+        {"op": "replace", "path": "/a", "value": 2},
+        {"op": "test", "path": "/a", "value": 2},
+    ])
+    assert cfg.a == 2
+
+
+def test_apply_patch_list_elements_keep_the_item_schema():
+    cfg = make()
+    cfg.apply_patch([{"op": "add", "path": "/items/-", "value": {"x": 2}}])
+    with pytest.raises(SchemaError):
+        cfg["items"][1].x = "bad"
+    assert cfg.to_dict()["items"] == [{"x": 1}, {"x": 2}]
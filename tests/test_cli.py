@@ -0,0 +1,37 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import yaml
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def run_cli(*args, cwd):
+    return subprocess.run(
+        [sys.executable, "-m", "loadstructure.cli", *args],
+        cwd=cwd, capture_output=True, text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")]))},
+    )
+
+
+def test_convert_with_from_writes_destination_format(tmp_path):
+    (tmp_path / "a.json").write_text(json.dumps({"db": {"port": 1}}))
+
+    result = run_cli("convert", "a.json", "b.yaml", "--from", "json", cwd=tmp_path)
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    text = (tmp_path / "b.yaml").read_text()
+    assert not text.lstrip().startswith("{")
+    assert yaml.safe_load(text) == {"db": {"port": 1}}
+
+
+def test_convert_with_to_overrides_extension(tmp_path):
+    (tmp_path / "a.yaml").write_text("x: 1\n")
+
+    result = run_cli("convert", "a.yaml", "out.cfg", "--to", "json", cwd=tmp_path)
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert json.loads((tmp_path / "out.cfg").read_text()) == {"x": 1}
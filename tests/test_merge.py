@@ -0,0 +1,22 @@
+from loadstructure import ConfigManager
+
+
+def test_merge_does_not_leak_overrides_into_yaml_aliases(tmp_path):
+    first = tmp_path / "m1.yaml"
+    first.write_text("defaults: &d {x: 1}\nsvc: *d\n")
+    second = tmp_path / "m2.yaml"
+    second.write_text("svc: {x: 2}\n")
+
+    merged = ConfigManager.merge([str(first), str(second)])
+
+    assert merged.get("svc.x") == 2
+    assert merged.get("defaults.x") == 1
+
+
+def test_merge_later_files_override_earlier_ones(tmp_path):
+    (tmp_path / "a.json").write_text('{"db": {"host": "a", "port": 1}, "x": 1}')
+    (tmp_path / "b.json").write_text('{"db": {"port": 2}, "y": 2}')
+
+    merged = ConfigManager.merge([str(tmp_path / "a.json"), str(tmp_path / "b.json")])
+
+    assert merged.to_dict() == {"db": {"host": "a", "port": 2}, "x": 1, "y": 2}
@@ -0,0 +1,32 @@
+import json
+import time
+
+from loadstructure import ConfigManager, ConfigPool
+
+
+def test_deleted_file_keeps_pooled_tree_and_is_not_recreated(tmp_path):
+    path = tmp_path / "c.json"
+    path.write_text(json.dumps({"a": 1}))
+    pool = ConfigPool(revalidate_interval=0)
+
+    assert ConfigManager.open(str(path), pool=pool).a == 1
+    path.unlink()
+    time.sleep(0.01)
+    config = ConfigManager.open(str(path), pool=pool)
+
+    assert config.to_dict() == {"a": 1}
+    assert not path.exists()
+
+
+def test_changed_file_is_reloaded(tmp_path):
+    path = tmp_path / "c.json"
+    path.write_text(json.dumps({"a": 1}))
+    pool = ConfigPool(revalidate_interval=0)
+
+    first = ConfigManager.open(str(path), pool=pool)
+    path.write_text(json.dumps({"a": 22}))
+    second = ConfigManager.open(str(path), pool=pool)
+
+    assert second is first
+    assert second.a == 22
+    assert pool.stats()["reloads"] == 1
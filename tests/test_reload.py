@@ -0,0 +1,22 @@
+import json
+
+import pytest
+
+from loadstructure import ConfigManager, SchemaError
+
+SCHEMA = {"a": int, "db": {"host": str, "port": int}}
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_invalid_reload_leaves_tree_untouched(tmp_path, lazy):
+    path = tmp_path / "c.json"
+    path.write_text(json.dumps({"a": 1, "db": {"host": "h", "port": 1}}))
+    config = ConfigManager(str(path), schema=SCHEMA, lazy=lazy)
+    config.load()
+
+    path.write_text(json.dumps({"a": 2, "db": {"host": "x", "port": "bad"}}))
+    with pytest.raises(SchemaError):
+        config.reload()
+
+    assert config.to_dict() == {"a": 1, "db": {"host": "h", "port": 1}}
+    assert not config.dirty
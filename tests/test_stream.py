@@ -0,0 +1,64 @@
+import pytest
+
+from loadstructure import ConfigManager
+from loadstructure.codec import get_codec
+from loadstructure.stream import build_selection, extract
+
+JSON_DOC = """{
+    "app": {"name": "x", "ui": {"theme": "dark", "size": [1, 2]}},
+    "modules": {"export": {"fmt": "csv"}, "editor": {"on": true}},
+    "dup": {"a": 1},
+    "skip": [{"deep": {"x": "}]{["}}],
+    "dup": {"b": 2},
+    "flat": 1,
+    "flat": 2
+}"""
+
+YAML_DOC = """\
+app:
+  name: x
+  ui: {theme: dark, size: [1, 2]}
+modules:
+  export: {fmt: csv}
+  editor: {"on": true}
+1: int key
+"2": str key
+true: bool key
+dup: {a: 1}
+dup: {b: 2}
+"""
+
+YAML_ALIASES = """\
+defaults: &d {x: 1, y: 2}
+svc: *d
+other:
+  <<: *d
+  y: 3
+"""
+
+XML_DOC = """<config>
+  <app name="x"><ui theme="dark">text</ui><tag>a</tag><tag>b</tag></app>
+  <modules><export><fmt>csv</fmt></export><editor on="true"/></modules>
+</config>"""
+
+SELECTIONS = [
+    ["app"], ["app.ui.theme"], ["app.ui", "modules.export"], ["modules.editor.on"],
+    ["dup"], ["dup.a"], ["dup.b"], ["flat"], ["missing"], ["app.name.deeper"],
+    ["1"], ["2"], ["true"], ["app.ui.@theme"], ["app.tag"], ["app.@name"],
+    ["svc.x"], ["other"], ["other.y"], ["defaults"],
+]
+
+
+@pytest.mark.parametrize("ext,text", [
+    (".json", JSON_DOC), (".yaml", YAML_DOC), (".yaml", YAML_ALIASES), (".xml", XML_DOC),
+], ids=["json", "yaml", "yaml-aliases", "xml"])
+@pytest.mark.parametrize("only", SELECTIONS, ids=",".join)
+def test_only_matches_full_load_plus_extract(tmp_path, ext, text, only):
+    path = tmp_path / f"c{ext}"
+    path.write_text(text)
+    full = get_codec(ext).load(path.read_bytes())
+
+    config = ConfigManager(str(path))
+    config.load(only=only)
+
+    assert config.to_dict() == extract(full, build_selection(only))